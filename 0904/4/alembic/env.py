@@ -1,8 +1,10 @@
+import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
-from sqlalchemy.engine import make_url
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -28,6 +30,25 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# The search index (e4b7c2d9a610) is raw SQL with no model counterpart:
+# SQLite FTS5 tables and their shadow tables, Postgres generated
+# search_vector columns and their GIN indexes. Keep autogenerate from
+# reporting them as removed.
+SEARCH_TABLE_PREFIXES = ('question_fts', 'answer_fts')
+SEARCH_INDEXES = frozenset({'ix_question_search_vector', 'ix_answer_search_vector'})
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    if not reflected or compare_to is not None:
+        return True
+    if type_ == 'table':
+        return not name.startswith(SEARCH_TABLE_PREFIXES)
+    if type_ == 'column':
+        return name != 'search_vector'
+    if type_ == 'index':
+        return name not in SEARCH_INDEXES
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -50,35 +71,53 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={'paramstyle': 'named'},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run migrations through the application's async driver.
+
+    Using the async engine lets the same DATABASE_URL (aiosqlite or
+    asyncpg) drive migrations without installing a sync DBAPI.
 
     """
-    parsed_url = make_url(str(settings.DATABASE_URL))
-    sync_dialect_name = parsed_url.get_dialect().name
-    sync_url = parsed_url.set(drivername=sync_dialect_name)
-    configuration = config.get_section(config.config_ini_section)
-    configuration['sqlalchemy.url'] = str(sync_url)
-    connectable = engine_from_config(
+    configuration = config.get_section(config.config_ini_section, {})
+    configuration['sqlalchemy.url'] = str(settings.DATABASE_URL)
+    connectable = async_engine_from_config(
         configuration,
         prefix='sqlalchemy.',
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
 
-        with context.begin_transaction():
-            context.run_migrations()
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    In this scenario we need to create an Engine
+    and associate a connection with the context.
+
+    """
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
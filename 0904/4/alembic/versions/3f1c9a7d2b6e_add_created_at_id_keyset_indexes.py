@@ -0,0 +1,31 @@
+"""Add (created_at, id) indexes for keyset pagination
+
+Revision ID: 3f1c9a7d2b6e
+Revises: 856eafb0a13e
+Create Date: 2026-10-17 09:12:44.531208
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b6e'
+down_revision: str | Sequence[str] | None = '856eafb0a13e'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_todo_created_at_id', 'todo', ['created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_question_created_at_id', 'question', ['created_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_question_created_at_id', table_name='question')
+    op.drop_index('ix_todo_created_at_id', table_name='todo')
@@ -0,0 +1,40 @@
+"""Add item_count table with live/deleted counters
+
+Revision ID: a7e4d2c91f05
+Revises: 3f1c9a7d2b6e
+Create Date: 2026-10-17 10:02:17.284519
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e4d2c91f05'
+down_revision: str | Sequence[str] | None = '3f1c9a7d2b6e'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'item_count',
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('live_count', sa.Integer(), nullable=False),
+        sa.Column('deleted_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('entity'),
+    )
+    for table in ('todo', 'question', 'answer'):
+        op.execute(
+            f'INSERT INTO item_count (entity, live_count, deleted_count) '
+            f"SELECT '{table}', COUNT(*) - COUNT(deleted_at), COUNT(deleted_at) "
+            f'FROM {table}'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('item_count')
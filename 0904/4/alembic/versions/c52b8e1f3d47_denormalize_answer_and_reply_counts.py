@@ -0,0 +1,48 @@
+"""Denormalize answer_count and reply_count into columns
+
+Revision ID: c52b8e1f3d47
+Revises: a7e4d2c91f05
+Create Date: 2026-10-17 11:26:53.904117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52b8e1f3d47'
+down_revision: str | Sequence[str] | None = 'a7e4d2c91f05'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'question',
+        sa.Column('answer_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'answer',
+        sa.Column('reply_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        'UPDATE question SET answer_count = ('
+        'SELECT COUNT(*) FROM answer '
+        'WHERE answer.question_id = question.id AND answer.deleted_at IS NULL)'
+    )
+    op.execute(
+        'UPDATE answer SET reply_count = ('
+        'SELECT COUNT(*) FROM answer AS replies '
+        'WHERE replies.parent_id = answer.id AND replies.deleted_at IS NULL)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('answer') as batch_op:
+        batch_op.drop_column('reply_count')
+    with op.batch_alter_table('question') as batch_op:
+        batch_op.drop_column('answer_count')
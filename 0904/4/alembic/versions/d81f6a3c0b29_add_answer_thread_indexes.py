@@ -0,0 +1,39 @@
+"""Add answer indexes for paginated thread loading
+
+Revision ID: d81f6a3c0b29
+Revises: c52b8e1f3d47
+Create Date: 2026-10-17 13:48:05.617342
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f6a3c0b29'
+down_revision: str | Sequence[str] | None = 'c52b8e1f3d47'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_answer_question_id_parent_id_created_at',
+        'answer',
+        ['question_id', 'parent_id', 'created_at', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_answer_parent_id_created_at',
+        'answer',
+        ['parent_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_answer_parent_id_created_at', table_name='answer')
+    op.drop_index('ix_answer_question_id_parent_id_created_at', table_name='answer')
@@ -0,0 +1,101 @@
+"""Add full-text search index over questions and answers
+
+Revision ID: e4b7c2d9a610
+Revises: d81f6a3c0b29
+Create Date: 2026-10-17 18:05:41.226108
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7c2d9a610'
+down_revision: str | Sequence[str] | None = 'd81f6a3c0b29'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_UPGRADE = (
+    'CREATE VIRTUAL TABLE question_fts USING fts5('
+    "subject, content, content='question', tokenize='unicode61')",
+    'CREATE VIRTUAL TABLE answer_fts USING fts5('
+    "content, content='answer', tokenize='unicode61')",
+    'CREATE TRIGGER question_fts_ai AFTER INSERT ON question BEGIN '
+    'INSERT INTO question_fts(rowid, subject, content) '
+    'VALUES (new.rowid, new.subject, new.content); END',
+    'CREATE TRIGGER question_fts_ad AFTER DELETE ON question BEGIN '
+    'INSERT INTO question_fts(question_fts, rowid, subject, content) '
+    "VALUES ('delete', old.rowid, old.subject, old.content); END",
+    'CREATE TRIGGER question_fts_au AFTER UPDATE OF subject, content ON question '
+    'BEGIN '
+    'INSERT INTO question_fts(question_fts, rowid, subject, content) '
+    "VALUES ('delete', old.rowid, old.subject, old.content); "
+    'INSERT INTO question_fts(rowid, subject, content) '
+    'VALUES (new.rowid, new.subject, new.content); END',
+    'CREATE TRIGGER answer_fts_ai AFTER INSERT ON answer BEGIN '
+    'INSERT INTO answer_fts(rowid, content) VALUES (new.rowid, new.content); END',
+    'CREATE TRIGGER answer_fts_ad AFTER DELETE ON answer BEGIN '
+    'INSERT INTO answer_fts(answer_fts, rowid, content) '
+    "VALUES ('delete', old.rowid, old.content); END",
+    'CREATE TRIGGER answer_fts_au AFTER UPDATE OF content ON answer BEGIN '
+    'INSERT INTO answer_fts(answer_fts, rowid, content) '
+    "VALUES ('delete', old.rowid, old.content); "
+    'INSERT INTO answer_fts(rowid, content) VALUES (new.rowid, new.content); END',
+    "INSERT INTO question_fts(question_fts) VALUES ('rebuild')",
+    "INSERT INTO answer_fts(answer_fts) VALUES ('rebuild')",
+)
+
+SQLITE_DOWNGRADE = (
+    'DROP TRIGGER IF EXISTS answer_fts_au',
+    'DROP TRIGGER IF EXISTS answer_fts_ad',
+    'DROP TRIGGER IF EXISTS answer_fts_ai',
+    'DROP TRIGGER IF EXISTS question_fts_au',
+    'DROP TRIGGER IF EXISTS question_fts_ad',
+    'DROP TRIGGER IF EXISTS question_fts_ai',
+    'DROP TABLE IF EXISTS answer_fts',
+    'DROP TABLE IF EXISTS question_fts',
+)
+
+POSTGRES_UPGRADE = (
+    'ALTER TABLE question ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ('
+    "setweight(to_tsvector('simple', coalesce(subject, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'B')) STORED",
+    'CREATE INDEX ix_question_search_vector ON question USING GIN (search_vector)',
+    'ALTER TABLE answer ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ('
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'C')) STORED",
+    'CREATE INDEX ix_answer_search_vector ON answer USING GIN (search_vector)',
+)
+
+POSTGRES_DOWNGRADE = (
+    'DROP INDEX IF EXISTS ix_answer_search_vector',
+    'ALTER TABLE answer DROP COLUMN IF EXISTS search_vector',
+    'DROP INDEX IF EXISTS ix_question_search_vector',
+    'ALTER TABLE question DROP COLUMN IF EXISTS search_vector',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        statements = SQLITE_UPGRADE
+    elif dialect == 'postgresql':
+        statements = POSTGRES_UPGRADE
+    else:
+        return
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        statements = SQLITE_DOWNGRADE
+    elif dialect == 'postgresql':
+        statements = POSTGRES_DOWNGRADE
+    else:
+        return
+    for statement in statements:
+        op.execute(statement)
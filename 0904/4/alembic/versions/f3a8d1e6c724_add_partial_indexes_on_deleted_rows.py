@@ -0,0 +1,39 @@
+"""Add partial keyset indexes over soft-deleted rows
+
+Revision ID: f3a8d1e6c724
+Revises: e4b7c2d9a610
+Create Date: 2026-10-17 18:31:12.480975
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d1e6c724'
+down_revision: str | Sequence[str] | None = 'e4b7c2d9a610'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ('todo', 'question', 'answer')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f'ix_{table}_deleted_created_at_id',
+            table,
+            ['created_at', 'id'],
+            unique=False,
+            sqlite_where=sa.text('deleted_at IS NOT NULL'),
+            postgresql_where=sa.text('deleted_at IS NOT NULL'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_deleted_created_at_id', table_name=table)
@@ -1,14 +1,49 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
+from src.infrastructure.adapters_in import metrics
 from src.infrastructure.adapters_in.http_api import api_router
+from src.infrastructure.adapters_in.purge import run_purge_worker
+from src.infrastructure.core.config import settings
+from src.infrastructure.core.database import AsyncSessionLocal
+from src.infrastructure.core.dependencies import hashing_pool, response_cache
 from src.infrastructure.core.exception_handlers import add_exception_handlers
+from src.infrastructure.core.metrics import MetricsMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    purge_task = None
+    if settings.PURGE_ENABLED:
+        purge_task = asyncio.create_task(
+            run_purge_worker(
+                AsyncSessionLocal,
+                interval_seconds=settings.PURGE_INTERVAL_SECONDS,
+                retention=timedelta(days=settings.PURGE_RETENTION_DAYS),
+                batch_size=settings.PURGE_BATCH_SIZE,
+                pause_seconds=settings.PURGE_BATCH_PAUSE_SECONDS,
+            )
+        )
+    yield
+    if purge_task is not None:
+        purge_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await purge_task
+    await response_cache.close()
+    hashing_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 add_exception_handlers(app)
 app.include_router(api_router, prefix='/api/v1')
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, 'src', 'static')
@@ -1,7 +1,12 @@
+import base64
+import binascii
+import json
 from datetime import date, datetime
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+from src.domain.exceptions import ValidationError
 
 T = TypeVar('T')
 
@@ -9,10 +14,25 @@ T = TypeVar('T')
 class PaginatedResponse(BaseModel, Generic[T]):
     model_config = ConfigDict(from_attributes=True)
 
-    total_items: int
+    total_items: int | None = None
     items: list[T]
-    page: int
+    page: int | None = None
     page_size: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), str(item_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError('Invalid pagination cursor.')
 
 
 def mask_ip(ip: str) -> str:
@@ -61,6 +81,67 @@ class TodoUpdateRequest(BaseModel):
     password: str
 
 
+class TodoBatchCreateRequest(BaseModel):
+    items: list[TodoCreateRequest] = Field(min_length=1, max_length=1000)
+
+
+class TodoBatchAuthItem(BaseModel):
+    id: str
+    password: str
+
+
+class TodoBatchAuthRequest(BaseModel):
+    items: list[TodoBatchAuthItem] = Field(min_length=1, max_length=1000)
+
+
+class TodoBatchItemResult(BaseModel):
+    id: str | None = None
+    success: bool
+    todo: TodoViewResponse | None = None
+    error: str | None = None
+
+
+class TodoBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[TodoBatchItemResult]
+
+
+class TodoImportRow(BaseModel):
+    id: str | None = None
+    task: str
+    due_date: date | None = None
+    is_completed: bool = False
+
+    @field_validator('id', 'due_date', mode='before')
+    @classmethod
+    def blank_to_none(cls, value: object) -> object:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @field_validator('is_completed', mode='before')
+    @classmethod
+    def blank_to_false(cls, value: object) -> object:
+        if isinstance(value, str) and not value.strip():
+            return False
+        return value
+
+
+class TodoImportError(BaseModel):
+    row: int
+    error: str
+
+
+class TodoImportReport(BaseModel):
+    processed: int = 0
+    imported: int = 0
+    skipped: int = 0
+    batches: int = 0
+    errors: list[TodoImportError] = []
+    aborted: TodoImportError | None = None
+
+
 class AnswerViewResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -155,3 +236,12 @@ class AdminDeletedItemsResponse(BaseModel):
     todos: PaginatedResponse[TodoViewResponse]
     questions: PaginatedResponse[QuestionViewResponse]
     answers: PaginatedResponse[AnswerViewResponse]
+
+
+class AdminBatchDeleteRequest(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=1000)
+
+
+class AdminBatchDeleteResponse(BaseModel):
+    deleted: list[str]
+    not_found: list[str]
@@ -1,9 +1,98 @@
-from typing import Protocol
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
+
+from src.application.dtos import (
+    AnswerViewResponse,
+    QuestionViewResponse,
+    TodoViewResponse,
+)
+from src.domain.repos import Cursor
+
+DeletedItemView = TodoViewResponse | QuestionViewResponse | AnswerViewResponse
 
 
 class PasswordManager(Protocol):
-    def hash(self, password: str) -> str:
-        ...
+    def hash(self, password: str) -> str: ...
+
+    def verify(self, password: str, password_hash: str) -> bool: ...
+
+    def needs_rehash(self, password_hash: str) -> bool: ...
+
+
+class AsyncPasswordManager(Protocol):
+    async def hash(self, password: str) -> str: ...
+
+    async def verify(self, password: str, password_hash: str) -> bool: ...
+
+    def needs_rehash(self, password_hash: str) -> bool: ...
+
+
+class Cache(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+
+class TodoQueries(Protocol):
+    async def get_list(
+        self, skip: int = 0, limit: int = 10, include_total: bool = True
+    ) -> tuple[list[TodoViewResponse], int | None]: ...
+
+    async def get_list_by_cursor(
+        self,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[TodoViewResponse], int | None]: ...
+
+    def stream_list(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[TodoViewResponse]]: ...
+
+
+class QuestionQueries(Protocol):
+    async def get_list(
+        self, skip: int = 0, limit: int = 10, include_total: bool = True
+    ) -> tuple[list[QuestionViewResponse], int | None]: ...
+
+    async def get_list_by_cursor(
+        self,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[QuestionViewResponse], int | None]: ...
+
+    def stream_list(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[QuestionViewResponse]]: ...
+
+    async def search(
+        self,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        include_total: bool = True,
+    ) -> tuple[list[QuestionViewResponse], int | None]: ...
+
+
+class AdminQueries(Protocol):
+    async def get_deleted_overview(
+        self, *, skip: int = 0, limit: int = 10
+    ) -> dict[str, tuple[list[DeletedItemView], int]]: ...
 
-    def verify(self, password: str, password_hash: str) -> bool:
-        ...
+    async def get_deleted_by_cursor(
+        self,
+        item_type: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[DeletedItemView], int | None]: ...
@@ -1,4 +1,14 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
 from src.application.dtos import (
+    AdminBatchDeleteRequest,
+    AdminBatchDeleteResponse,
     AdminDeletedItemsResponse,
     AnswerCreateRequest,
     AnswerUpdateRequest,
@@ -8,11 +18,28 @@ from src.application.dtos import (
     QuestionCreateRequest,
     QuestionUpdateRequest,
     QuestionViewResponse,
+    TodoBatchAuthItem,
+    TodoBatchAuthRequest,
+    TodoBatchCreateRequest,
+    TodoBatchItemResult,
+    TodoBatchResponse,
     TodoCreateRequest,
+    TodoImportError,
+    TodoImportReport,
+    TodoImportRow,
     TodoUpdateRequest,
     TodoViewResponse,
+    decode_cursor,
+    encode_cursor,
+)
+from src.application.ports import (
+    AdminQueries,
+    AsyncPasswordManager,
+    Cache,
+    DeletedItemView,
+    QuestionQueries,
+    TodoQueries,
 )
-from src.application.ports import PasswordManager
 from src.domain.entity import Answer, Question, Todo
 from src.domain.exceptions import (
     AuthorizationError,
@@ -22,17 +49,141 @@ from src.domain.exceptions import (
 )
 from src.domain.repos import (
     AnswerRepository,
+    Cursor,
     QuestionRepository,
     TodoRepository,
     UnitOfWork,
 )
 
 
+def _cursor_of(item: Todo | Question | Answer | DeletedItemView) -> str:
+    return encode_cursor(item.created_at, item.id)
+
+
+def _decode_cursors(
+    after: str | None, before: str | None
+) -> tuple[Cursor | None, Cursor | None]:
+    if after is not None and before is not None:
+        raise ValidationError('Only one of after and before can be given.')
+    return (
+        decode_cursor(after) if after is not None else None,
+        decode_cursor(before) if before is not None else None,
+    )
+
+
+def _offset_cursors(
+    items: list[TodoViewResponse] | list[QuestionViewResponse] | list[DeletedItemView],
+    *,
+    skip: int,
+    limit: int,
+    total: int | None,
+) -> tuple[str | None, str | None]:
+    if not items:
+        return None, None
+    has_next = len(items) == limit if total is None else skip + len(items) < total
+    prev_cursor = _cursor_of(items[0]) if skip > 0 else None
+    next_cursor = _cursor_of(items[-1]) if has_next else None
+    return prev_cursor, next_cursor
+
+
+def _cursor_window(
+    items: list[TodoViewResponse]
+    | list[QuestionViewResponse]
+    | list[DeletedItemView]
+    | list[Answer],
+    *,
+    limit: int,
+    after: Cursor | None,
+    before: Cursor | None,
+) -> tuple[
+    list[TodoViewResponse]
+    | list[QuestionViewResponse]
+    | list[DeletedItemView]
+    | list[Answer],
+    str | None,
+    str | None,
+]:
+    has_more = len(items) > limit
+    if before is not None:
+        items = items[-limit:]
+        has_prev, has_next = has_more, True
+    else:
+        items = items[:limit]
+        has_prev, has_next = after is not None, has_more
+
+    if not items:
+        return items, None, None
+    prev_cursor = _cursor_of(items[0]) if has_prev else None
+    next_cursor = _cursor_of(items[-1]) if has_next else None
+    return items, prev_cursor, next_cursor
+
+
+async def _cached(
+    cache: Cache | None, key: str, load: Callable[[], Awaitable[Any]]
+) -> Any:
+    if cache is None:
+        return await load()
+    value = await cache.get(key)
+    if value is None:
+        value = await load()
+        await cache.set(key, value)
+    return value
+
+
+CACHED_MODELS: tuple[type[BaseModel], ...] = (
+    TodoViewResponse,
+    QuestionViewResponse,
+    PaginatedResponse[TodoViewResponse],
+    PaginatedResponse[QuestionViewResponse],
+)
+
+
+async def _list_key(cache: Cache | None, entity: str, *params: object) -> str:
+    generation = None
+    if cache is not None:
+        generation_key = f'{entity}:list:generation'
+        generation = await cache.get(generation_key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            await cache.set(generation_key, generation)
+    return ':'.join([entity, 'list', str(generation), *map(str, params)])
+
+
+async def _invalidate(
+    cache: Cache | None, entity: str, *keys: str, lists: bool = True
+) -> None:
+    if cache is None:
+        return
+    if lists:
+        keys = (*keys, f'{entity}:list:generation')
+    await cache.delete(*keys)
+
+
+def _batch_response(results: list[TodoBatchItemResult]) -> TodoBatchResponse:
+    succeeded = sum(result.success for result in results)
+    return TodoBatchResponse(
+        succeeded=succeeded, failed=len(results) - succeeded, results=results
+    )
+
+
+def _first_error(error: PydanticValidationError) -> str:
+    detail = error.errors()[0]
+    location = '.'.join(map(str, detail['loc']))
+    return f'{location}: {detail["msg"]}' if location else detail['msg']
+
+
+def _question_keys(question_id: str) -> tuple[str, str]:
+    return f'question:{question_id}:thread', f'question:{question_id}'
+
+
 class BaseService:
-    def __init__(self, *, password_manager: PasswordManager):
+    def __init__(
+        self, *, password_manager: AsyncPasswordManager, cache: Cache | None = None
+    ):
         self.password_manager = password_manager
+        self.cache = cache
 
-    def _check_permission(
+    async def _check_permission(
         self,
         *,
         password_hash: str,
@@ -40,15 +191,32 @@ class BaseService:
     ) -> None:
         if not password:
             raise AuthorizationError('Password is required.')
-        if not self.password_manager.verify(password, password_hash):
+        if not await self.password_manager.verify(password, password_hash):
             raise AuthorizationError('Invalid password.')
         return
 
+    async def _authorize(
+        self, item: Todo | Question | Answer, *, password: str | None
+    ) -> None:
+        await self._check_permission(
+            password_hash=item.password_hash, password=password
+        )
+        if self.password_manager.needs_rehash(item.password_hash):
+            item.password_hash = await self.password_manager.hash(password)
+
 
 class TodoService(BaseService):
-    def __init__(self, *, todo_repo: TodoRepository, password_manager: PasswordManager):
+    def __init__(
+        self,
+        *,
+        todo_repo: TodoRepository,
+        todo_queries: TodoQueries,
+        password_manager: AsyncPasswordManager,
+        cache: Cache | None = None,
+    ):
         self.todo_repo = todo_repo
-        super().__init__(password_manager=password_manager)
+        self.todo_queries = todo_queries
+        super().__init__(password_manager=password_manager, cache=cache)
 
     async def create_todo(
         self, *, todo_dto: TodoCreateRequest, creator_ip: str
@@ -56,7 +224,7 @@ class TodoService(BaseService):
         if not todo_dto.task:
             raise EmptyTaskError('Task cannot be empty.')
 
-        hashed_pw = self.password_manager.hash(todo_dto.password)
+        hashed_pw = await self.password_manager.hash(todo_dto.password)
         new_todo = Todo(
             task=todo_dto.task,
             due_date=todo_dto.due_date,
@@ -64,20 +232,135 @@ class TodoService(BaseService):
             password_hash=hashed_pw,
         )
         created_todo = await self.todo_repo.add(new_todo)
+        await _invalidate(self.cache, 'todo')
         return TodoViewResponse.model_validate(created_todo)
 
+    async def create_todos(
+        self, *, batch: TodoBatchCreateRequest, creator_ip: str
+    ) -> TodoBatchResponse:
+        results: list[TodoBatchItemResult | None] = [None] * len(batch.items)
+        valid: list[tuple[int, TodoCreateRequest]] = []
+        for index, todo_dto in enumerate(batch.items):
+            if todo_dto.task:
+                valid.append((index, todo_dto))
+            else:
+                results[index] = TodoBatchItemResult(
+                    success=False, error=EmptyTaskError().message
+                )
+
+        hashed_pws = await asyncio.gather(
+            *(self.password_manager.hash(todo_dto.password) for _, todo_dto in valid)
+        )
+        created_todos = await self.todo_repo.add_many(
+            [
+                Todo(
+                    task=todo_dto.task,
+                    due_date=todo_dto.due_date,
+                    creator_ip=creator_ip,
+                    password_hash=hashed_pw,
+                )
+                for (_, todo_dto), hashed_pw in zip(valid, hashed_pws, strict=True)
+            ]
+        )
+        for (index, _), todo in zip(valid, created_todos, strict=True):
+            results[index] = TodoBatchItemResult(
+                id=todo.id, success=True, todo=TodoViewResponse.model_validate(todo)
+            )
+
+        if created_todos:
+            await _invalidate(self.cache, 'todo')
+        return _batch_response(results)
+
     async def get_todos(
-        self, *, skip: int = 0, limit: int = 10
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        include_total: bool = True,
     ) -> PaginatedResponse[TodoViewResponse]:
-        todos, total = await self.todo_repo.get_list(skip=skip, limit=limit)
+        key = await _list_key(
+            self.cache, 'todo', skip, limit, after, before, include_total
+        )
+        return await _cached(
+            self.cache,
+            key,
+            lambda: self._load_todos(
+                skip=skip,
+                limit=limit,
+                after=after,
+                before=before,
+                include_total=include_total,
+            ),
+        )
+
+    async def _load_todos(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        after: str | None,
+        before: str | None,
+        include_total: bool,
+    ) -> PaginatedResponse[TodoViewResponse]:
+        if after is not None or before is not None:
+            return await self._get_todos_by_cursor(
+                limit=limit, after=after, before=before, include_total=include_total
+            )
+
+        todos, total = await self.todo_queries.get_list(
+            skip=skip, limit=limit, include_total=include_total
+        )
+        prev_cursor, next_cursor = _offset_cursors(
+            todos, skip=skip, limit=limit, total=total
+        )
         return PaginatedResponse(
             total_items=total,
-            items=[TodoViewResponse.model_validate(t) for t in todos],
+            items=todos,
             page=(skip // limit) + 1,
             page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    async def _get_todos_by_cursor(
+        self,
+        *,
+        limit: int,
+        after: str | None,
+        before: str | None,
+        include_total: bool,
+    ) -> PaginatedResponse[TodoViewResponse]:
+        after_key, before_key = _decode_cursors(after, before)
+        todos, total = await self.todo_queries.get_list_by_cursor(
+            limit=limit + 1,
+            after=after_key,
+            before=before_key,
+            include_total=include_total,
+        )
+        todos, prev_cursor, next_cursor = _cursor_window(
+            todos, limit=limit, after=after_key, before=before_key
+        )
+        return PaginatedResponse(
+            total_items=total,
+            items=todos,
+            page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
+    def export_todos(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[TodoViewResponse]]:
+        return self.todo_queries.stream_list(batch_size=batch_size)
+
     async def get_todo(self, *, todo_id: str) -> TodoViewResponse:
+        return await _cached(
+            self.cache, f'todo:{todo_id}', lambda: self._load_todo(todo_id)
+        )
+
+    async def _load_todo(self, todo_id: str) -> TodoViewResponse:
         todo = await self.todo_repo.get(todo_id)
         if todo is None:
             raise NotFoundError(f'Todo with id {todo_id} not found.')
@@ -89,12 +372,11 @@ class TodoService(BaseService):
         todo = await self.todo_repo.get(todo_id)
         if todo is None:
             raise NotFoundError(f'Todo with id {todo_id} not found.')
-        self._check_permission(
-            password_hash=todo.password_hash, password=todo_dto.password
-        )
+        await self._authorize(todo, password=todo_dto.password)
 
         todo.update(task=todo_dto.task, due_date=todo_dto.due_date)
         updated_todo = await self.todo_repo.update(todo)
+        await _invalidate(self.cache, 'todo', f'todo:{todo_id}')
         return TodoViewResponse.model_validate(updated_todo)
 
     async def complete_todo(
@@ -103,10 +385,11 @@ class TodoService(BaseService):
         todo = await self.todo_repo.get(todo_id)
         if todo is None:
             raise NotFoundError(f'Todo with id {todo_id} not found.')
-        self._check_permission(password_hash=todo.password_hash, password=auth.password)
+        await self._authorize(todo, password=auth.password)
 
         todo.complete()
         updated_todo = await self.todo_repo.update(todo)
+        await _invalidate(self.cache, 'todo', f'todo:{todo_id}')
         return TodoViewResponse.model_validate(updated_todo)
 
     async def uncomplete_todo(
@@ -115,32 +398,116 @@ class TodoService(BaseService):
         todo = await self.todo_repo.get(todo_id)
         if todo is None:
             raise NotFoundError(f'Todo with id {todo_id} not found.')
-        self._check_permission(password_hash=todo.password_hash, password=auth.password)
+        await self._authorize(todo, password=auth.password)
 
         todo.uncomplete()
         updated_todo = await self.todo_repo.update(todo)
+        await _invalidate(self.cache, 'todo', f'todo:{todo_id}')
         return TodoViewResponse.model_validate(updated_todo)
 
     async def delete_todo(self, *, todo_id: str, auth: AuthRequest) -> None:
         todo = await self.todo_repo.get(todo_id)
         if todo is None:
             raise NotFoundError(f'Todo with id {todo_id} not found.')
-        self._check_permission(password_hash=todo.password_hash, password=auth.password)
+        await self._check_permission(
+            password_hash=todo.password_hash, password=auth.password
+        )
 
         await self.todo_repo.delete(todo_id)
+        await _invalidate(self.cache, 'todo', f'todo:{todo_id}')
+
+    async def complete_todos(self, *, batch: TodoBatchAuthRequest) -> TodoBatchResponse:
+        errors = await self._authorize_batch(batch.items)
+        authorized_ids = list(
+            {
+                item.id
+                for item, error in zip(batch.items, errors, strict=True)
+                if error is None
+            }
+        )
+        updated_todos = {
+            todo.id: TodoViewResponse.model_validate(todo)
+            for todo in await self.todo_repo.set_completed_many(
+                authorized_ids, is_completed=True
+            )
+        }
+        await self._invalidate_batch(authorized_ids)
+        return _batch_response(
+            [
+                TodoBatchItemResult(
+                    id=item.id,
+                    success=error is None,
+                    todo=updated_todos.get(item.id),
+                    error=error,
+                )
+                for item, error in zip(batch.items, errors, strict=True)
+            ]
+        )
+
+    async def delete_todos(self, *, batch: TodoBatchAuthRequest) -> TodoBatchResponse:
+        errors = await self._authorize_batch(batch.items)
+        authorized_ids = list(
+            {
+                item.id
+                for item, error in zip(batch.items, errors, strict=True)
+                if error is None
+            }
+        )
+        await self.todo_repo.delete_many(authorized_ids)
+        await self._invalidate_batch(authorized_ids)
+        return _batch_response(
+            [
+                TodoBatchItemResult(id=item.id, success=error is None, error=error)
+                for item, error in zip(batch.items, errors, strict=True)
+            ]
+        )
+
+    async def _authorize_batch(
+        self, items: list[TodoBatchAuthItem]
+    ) -> list[str | None]:
+        todos = {
+            todo.id: todo
+            for todo in await self.todo_repo.get_many(list({item.id for item in items}))
+        }
+
+        async def check(item: TodoBatchAuthItem) -> str | None:
+            todo = todos.get(item.id)
+            if todo is None:
+                return f'Todo with id {item.id} not found.'
+            try:
+                await self._check_permission(
+                    password_hash=todo.password_hash, password=item.password
+                )
+            except AuthorizationError as e:
+                return e.message
+            return None
+
+        return list(await asyncio.gather(*(check(item) for item in items)))
+
+    async def _invalidate_batch(self, todo_ids: list[str]) -> None:
+        if todo_ids:
+            await _invalidate(
+                self.cache, 'todo', *(f'todo:{todo_id}' for todo_id in todo_ids)
+            )
 
 
 class QuestionService(BaseService):
     def __init__(
-        self, *, question_repo: QuestionRepository, password_manager: PasswordManager
+        self,
+        *,
+        question_repo: QuestionRepository,
+        question_queries: QuestionQueries,
+        password_manager: AsyncPasswordManager,
+        cache: Cache | None = None,
     ):
         self.question_repo = question_repo
-        super().__init__(password_manager=password_manager)
+        self.question_queries = question_queries
+        super().__init__(password_manager=password_manager, cache=cache)
 
     async def create_question(
         self, *, question_dto: QuestionCreateRequest, creator_ip: str
     ) -> QuestionViewResponse:
-        hashed_pw = self.password_manager.hash(question_dto.password)
+        hashed_pw = await self.password_manager.hash(question_dto.password)
         new_question = Question(
             subject=question_dto.subject,
             content=question_dto.content,
@@ -148,21 +515,131 @@ class QuestionService(BaseService):
             password_hash=hashed_pw,
         )
         created_question = await self.question_repo.add(new_question)
+        await _invalidate(self.cache, 'question')
         return QuestionViewResponse.model_validate(created_question)
 
     async def get_questions(
-        self, *, skip: int = 0, limit: int = 10
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        include_total: bool = True,
+    ) -> PaginatedResponse[QuestionViewResponse]:
+        key = await _list_key(
+            self.cache, 'question', skip, limit, after, before, include_total
+        )
+        return await _cached(
+            self.cache,
+            key,
+            lambda: self._load_questions(
+                skip=skip,
+                limit=limit,
+                after=after,
+                before=before,
+                include_total=include_total,
+            ),
+        )
+
+    async def _load_questions(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        after: str | None,
+        before: str | None,
+        include_total: bool,
     ) -> PaginatedResponse[QuestionViewResponse]:
-        questions, total = await self.question_repo.get_list(skip=skip, limit=limit)
+        if after is not None or before is not None:
+            return await self._get_questions_by_cursor(
+                limit=limit, after=after, before=before, include_total=include_total
+            )
+
+        questions, total = await self.question_queries.get_list(
+            skip=skip, limit=limit, include_total=include_total
+        )
+        prev_cursor, next_cursor = _offset_cursors(
+            questions, skip=skip, limit=limit, total=total
+        )
         return PaginatedResponse(
             total_items=total,
-            items=[QuestionViewResponse.model_validate(q) for q in questions],
+            items=questions,
             page=(skip // limit) + 1,
             page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
-    async def get_question(self, *, question_id: str) -> QuestionViewResponse:
-        question = await self.question_repo.get(question_id)
+    async def _get_questions_by_cursor(
+        self,
+        *,
+        limit: int,
+        after: str | None,
+        before: str | None,
+        include_total: bool,
+    ) -> PaginatedResponse[QuestionViewResponse]:
+        after_key, before_key = _decode_cursors(after, before)
+        questions, total = await self.question_queries.get_list_by_cursor(
+            limit=limit + 1,
+            after=after_key,
+            before=before_key,
+            include_total=include_total,
+        )
+        questions, prev_cursor, next_cursor = _cursor_window(
+            questions, limit=limit, after=after_key, before=before_key
+        )
+        return PaginatedResponse(
+            total_items=total,
+            items=questions,
+            page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    async def search_questions(
+        self,
+        *,
+        query: str,
+        skip: int = 0,
+        limit: int = 10,
+        include_total: bool = True,
+    ) -> PaginatedResponse[QuestionViewResponse]:
+        if not query.strip():
+            raise ValidationError('Search query cannot be empty.')
+
+        questions, total = await self.question_queries.search(
+            query, skip=skip, limit=limit, include_total=include_total
+        )
+        return PaginatedResponse(
+            total_items=total,
+            items=questions,
+            page=(skip // limit) + 1,
+            page_size=limit,
+        )
+
+    def export_questions(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[QuestionViewResponse]]:
+        return self.question_queries.stream_list(batch_size=batch_size)
+
+    async def get_question(
+        self, *, question_id: str, include_answers: bool = True
+    ) -> QuestionViewResponse:
+        thread_key, question_key = _question_keys(question_id)
+        return await _cached(
+            self.cache,
+            thread_key if include_answers else question_key,
+            lambda: self._load_question(question_id, include_answers),
+        )
+
+    async def _load_question(
+        self, question_id: str, include_answers: bool
+    ) -> QuestionViewResponse:
+        if include_answers:
+            question = await self.question_repo.get_thread(question_id)
+        else:
+            question = await self.question_repo.get(question_id)
         if question is None:
             raise NotFoundError(f'Question with id {question_id} not found.')
         return QuestionViewResponse.model_validate(question)
@@ -173,24 +650,23 @@ class QuestionService(BaseService):
         question = await self.question_repo.get(question_id)
         if question is None:
             raise NotFoundError(f'Question with id {question_id} not found.')
-        self._check_permission(
-            password_hash=question.password_hash, password=question_dto.password
-        )
+        await self._authorize(question, password=question_dto.password)
 
         question.update(subject=question_dto.subject, content=question_dto.content)
-        return QuestionViewResponse.model_validate(
-            await self.question_repo.update(question)
-        )
+        updated_question = await self.question_repo.update(question)
+        await _invalidate(self.cache, 'question', *_question_keys(question_id))
+        return QuestionViewResponse.model_validate(updated_question)
 
     async def delete_question(self, *, question_id: str, auth: AuthRequest) -> None:
         question = await self.question_repo.get(question_id)
         if question is None:
             raise NotFoundError(f'Question with id {question_id} not found.')
-        self._check_permission(
+        await self._check_permission(
             password_hash=question.password_hash, password=auth.password
         )
 
         await self.question_repo.delete(question_id)
+        await _invalidate(self.cache, 'question', *_question_keys(question_id))
 
 
 class AnswerService(BaseService):
@@ -199,11 +675,12 @@ class AnswerService(BaseService):
         *,
         answer_repo: AnswerRepository,
         question_repo: QuestionRepository,
-        password_manager: PasswordManager,
+        password_manager: AsyncPasswordManager,
+        cache: Cache | None = None,
     ):
         self.answer_repo = answer_repo
         self.question_repo = question_repo
-        super().__init__(password_manager=password_manager)
+        super().__init__(password_manager=password_manager, cache=cache)
 
     async def create_answer(
         self, *, answer_dto: AnswerCreateRequest, creator_ip: str
@@ -223,7 +700,7 @@ class AnswerService(BaseService):
                     'Parent answer does not belong to the same question.'
                 )
 
-        hashed_pw = self.password_manager.hash(answer_dto.password)
+        hashed_pw = await self.password_manager.hash(answer_dto.password)
         new_answer = Answer(
             content=answer_dto.content,
             question_id=answer_dto.question_id,
@@ -232,6 +709,9 @@ class AnswerService(BaseService):
             password_hash=hashed_pw,
         )
         created_answer = await self.answer_repo.add(new_answer)
+        await _invalidate(
+            self.cache, 'question', *_question_keys(answer_dto.question_id)
+        )
         return AnswerViewResponse.model_validate(created_answer)
 
     async def get_answer(self, *, answer_id: str) -> AnswerViewResponse:
@@ -240,104 +720,324 @@ class AnswerService(BaseService):
             raise NotFoundError(f'Answer with id {answer_id} not found.')
         return AnswerViewResponse.model_validate(answer)
 
+    async def get_answers(
+        self,
+        *,
+        question_id: str,
+        limit: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        include_total: bool = True,
+    ) -> PaginatedResponse[AnswerViewResponse]:
+        if await self.question_repo.get(question_id) is None:
+            raise NotFoundError(f'Question with id {question_id} not found.')
+
+        after_key, before_key = _decode_cursors(after, before)
+        answers, total = await self.answer_repo.get_answers_by_cursor(
+            question_id,
+            limit=limit + 1,
+            after=after_key,
+            before=before_key,
+            include_total=include_total,
+        )
+        return self._answer_page(
+            answers, total=total, limit=limit, after=after_key, before=before_key
+        )
+
+    async def get_replies(
+        self,
+        *,
+        answer_id: str,
+        limit: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        include_total: bool = True,
+    ) -> PaginatedResponse[AnswerViewResponse]:
+        if await self.answer_repo.get_any(answer_id) is None:
+            raise NotFoundError(f'Answer with id {answer_id} not found.')
+
+        after_key, before_key = _decode_cursors(after, before)
+        replies, total = await self.answer_repo.get_replies_by_cursor(
+            answer_id,
+            limit=limit + 1,
+            after=after_key,
+            before=before_key,
+            include_total=include_total,
+        )
+        return self._answer_page(
+            replies, total=total, limit=limit, after=after_key, before=before_key
+        )
+
+    @staticmethod
+    def _answer_page(
+        answers: list[Answer],
+        *,
+        total: int | None,
+        limit: int,
+        after: Cursor | None,
+        before: Cursor | None,
+    ) -> PaginatedResponse[AnswerViewResponse]:
+        answers, prev_cursor, next_cursor = _cursor_window(
+            answers, limit=limit, after=after, before=before
+        )
+        return PaginatedResponse(
+            total_items=total,
+            items=[AnswerViewResponse.model_validate(a) for a in answers],
+            page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
     async def update_answer(
         self, *, answer_id: str, answer_dto: AnswerUpdateRequest
     ) -> AnswerViewResponse:
         answer = await self.answer_repo.get(answer_id)
         if answer is None:
             raise NotFoundError(f'Answer with id {answer_id} not found.')
-        self._check_permission(
-            password_hash=answer.password_hash, password=answer_dto.password
-        )
+        await self._authorize(answer, password=answer_dto.password)
 
         answer.update(content=answer_dto.content)
         updated_answer = await self.answer_repo.update(answer)
+        await _invalidate(
+            self.cache, 'question', *_question_keys(answer.question_id), lists=False
+        )
         return AnswerViewResponse.model_validate(updated_answer)
 
     async def delete_answer(self, *, answer_id: str, auth: AuthRequest) -> None:
         answer = await self.answer_repo.get(answer_id)
         if answer is None:
             raise NotFoundError(f'Answer with id {answer_id} not found.')
-        self._check_permission(
+        await self._check_permission(
             password_hash=answer.password_hash, password=auth.password
         )
 
         await self.answer_repo.delete(answer_id)
+        await _invalidate(self.cache, 'question', *_question_keys(answer.question_id))
 
 
 class AdminService:
-    def __init__(self, *, uow: UnitOfWork):
+    ITEM_TYPES = ('todos', 'questions', 'answers')
+
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        admin_queries: AdminQueries | None = None,
+        cache: Cache | None = None,
+    ):
         self.uow = uow
+        self.admin_queries = admin_queries
+        self.cache = cache
 
     async def get_deleted_items(
         self, *, skip: int, limit: int
     ) -> AdminDeletedItemsResponse:
-        page = (skip // limit) + 1
+        overview = await self.admin_queries.get_deleted_overview(skip=skip, limit=limit)
+        pages = {}
+        for item_type, (items, total) in overview.items():
+            prev_cursor, next_cursor = _offset_cursors(
+                items, skip=skip, limit=limit, total=total
+            )
+            pages[item_type] = PaginatedResponse(
+                total_items=total,
+                items=items,
+                page=(skip // limit) + 1,
+                page_size=limit,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+            )
+        return AdminDeletedItemsResponse(**pages)
 
-        deleted_todos, total_todos = await self.uow.todo_repo.get_deleted_list(
-            skip=skip, limit=limit
+    async def get_deleted_items_by_cursor(
+        self,
+        *,
+        item_type: str,
+        limit: int = 10,
+        after: str | None = None,
+        before: str | None = None,
+        include_total: bool = True,
+    ) -> PaginatedResponse[DeletedItemView]:
+        if item_type not in self.ITEM_TYPES:
+            raise NotFoundError(f'Invalid item type: {item_type}')
+
+        after_key, before_key = _decode_cursors(after, before)
+        items, total = await self.admin_queries.get_deleted_by_cursor(
+            item_type,
+            limit=limit + 1,
+            after=after_key,
+            before=before_key,
+            include_total=include_total,
         )
-        (
-            deleted_questions,
-            total_questions,
-        ) = await self.uow.question_repo.get_deleted_list(skip=skip, limit=limit)
-        deleted_answers, total_answers = await self.uow.answer_repo.get_deleted_list(
-            skip=skip, limit=limit
+        items, prev_cursor, next_cursor = _cursor_window(
+            items, limit=limit, after=after_key, before=before_key
         )
-
-        return AdminDeletedItemsResponse(
-            todos=PaginatedResponse(
-                total_items=total_todos,
-                items=[TodoViewResponse.model_validate(t) for t in deleted_todos],
-                page=page,
-                page_size=limit,
-            ),
-            questions=PaginatedResponse(
-                total_items=total_questions,
-                items=[
-                    QuestionViewResponse.model_validate(q) for q in deleted_questions
-                ],
-                page=page,
-                page_size=limit,
-            ),
-            answers=PaginatedResponse(
-                total_items=total_answers,
-                items=[AnswerViewResponse.model_validate(a) for a in deleted_answers],
-                page=page,
-                page_size=limit,
-            ),
+        return PaginatedResponse(
+            total_items=total,
+            items=items,
+            page_size=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
     async def soft_delete_item(self, *, item_type: str, item_id: str) -> None:
-        repo = None
-        if item_type == 'todos':
-            repo = self.uow.todo_repo
-        elif item_type == 'questions':
-            repo = self.uow.question_repo
-        elif item_type == 'answers':
-            repo = self.uow.answer_repo
-        else:
-            raise NotFoundError(f'Invalid item type: {item_type}')
+        deleted = await self._repo(item_type).delete_many([item_id])
+        if not deleted:
+            raise NotFoundError(f'{item_type} with id {item_id} not found.')
+        await self._invalidate_deleted(item_type, deleted)
 
-        item = await repo.get(item_id)
-        if item is None:
+    async def hard_delete_item(self, *, item_type: str, item_id: str) -> None:
+        deleted = await self._repo(item_type).hard_delete_many([item_id])
+        if not deleted:
             raise NotFoundError(f'{item_type} with id {item_id} not found.')
+        await self._invalidate_deleted(item_type, deleted)
 
-        await repo.delete(item_id)
+    async def soft_delete_items(
+        self, *, item_type: str, batch: AdminBatchDeleteRequest
+    ) -> AdminBatchDeleteResponse:
+        ids = list(dict.fromkeys(batch.ids))
+        deleted = await self._repo(item_type).delete_many(ids)
+        return await self._batch_deleted(item_type, ids, deleted)
 
-    async def hard_delete_item(self, *, item_type: str, item_id: str) -> None:
-        repo = None
+    async def hard_delete_items(
+        self, *, item_type: str, batch: AdminBatchDeleteRequest
+    ) -> AdminBatchDeleteResponse:
+        ids = list(dict.fromkeys(batch.ids))
+        deleted = await self._repo(item_type).hard_delete_many(ids)
+        return await self._batch_deleted(item_type, ids, deleted)
+
+    def _repo(
+        self, item_type: str
+    ) -> TodoRepository | QuestionRepository | AnswerRepository:
         if item_type == 'todos':
-            repo = self.uow.todo_repo
-        elif item_type == 'questions':
-            repo = self.uow.question_repo
-        elif item_type == 'answers':
-            repo = self.uow.answer_repo
-        else:
-            raise NotFoundError(f'Invalid item type: {item_type}')
+            return self.uow.todo_repo
+        if item_type == 'questions':
+            return self.uow.question_repo
+        if item_type == 'answers':
+            return self.uow.answer_repo
+        raise NotFoundError(f'Invalid item type: {item_type}')
 
-        item = await repo.get_any(item_id)
-        if item is None:
-            raise NotFoundError(f'{item_type} with id {item_id} not found.')
+    async def _batch_deleted(
+        self, item_type: str, ids: list[str], deleted: list[str] | dict[str, str]
+    ) -> AdminBatchDeleteResponse:
+        if deleted:
+            await self._invalidate_deleted(item_type, deleted)
+        return AdminBatchDeleteResponse(
+            deleted=list(deleted),
+            not_found=[item_id for item_id in ids if item_id not in deleted],
+        )
 
-        await repo.hard_delete(item_id)
+    async def _invalidate_deleted(
+        self, item_type: str, deleted: list[str] | dict[str, str]
+    ) -> None:
+        if item_type == 'todos':
+            await _invalidate(
+                self.cache, 'todo', *(f'todo:{todo_id}' for todo_id in deleted)
+            )
+            return
+        # Answer deletes map each deleted answer to its question.
+        question_ids = set(deleted.values() if isinstance(deleted, dict) else deleted)
+        keys = [key for qid in question_ids for key in _question_keys(qid)]
+        await _invalidate(self.cache, 'question', *keys)
+
+
+class TodoImportService:
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(
+        self,
+        *,
+        uow: UnitOfWork,
+        password_manager: AsyncPasswordManager,
+        cache: Cache | None = None,
+    ):
+        self.uow = uow
+        self.password_manager = password_manager
+        self.cache = cache
+
+    async def import_todos(
+        self,
+        rows: AsyncIterable[dict[str, str]],
+        *,
+        password: str,
+        creator_ip: str,
+        batch_size: int = 500,
+        on_progress: Callable[[TodoImportReport], None] | None = None,
+    ) -> TodoImportReport:
+        if not password:
+            raise AuthorizationError('Password is required.')
+        hashed_pw = await self.password_manager.hash(password)
+        report = TodoImportReport()
+
+        batch: list[tuple[int, Todo]] = []
+        try:
+            async for row in rows:
+                report.processed += 1
+                row_number = report.processed
+                try:
+                    todo_row = TodoImportRow.model_validate(row)
+                except PydanticValidationError as e:
+                    self._record_error(report, row_number, _first_error(e))
+                    continue
+                if not todo_row.task.strip():
+                    self._record_error(report, row_number, EmptyTaskError().message)
+                    continue
+
+                todo = Todo(
+                    task=todo_row.task,
+                    due_date=todo_row.due_date,
+                    is_completed=todo_row.is_completed,
+                    creator_ip=creator_ip,
+                    password_hash=hashed_pw,
+                )
+                if todo_row.id:
+                    todo.id = todo_row.id
+                batch.append((row_number, todo))
+
+                if len(batch) >= batch_size:
+                    await self._flush_batch(report, batch)
+                    batch = []
+                    if on_progress is not None:
+                        on_progress(report)
+        except ValidationError as e:
+            # The source broke part-way through (bad encoding, malformed CSV).
+            # Earlier batches are already committed, so keep the rows read so
+            # far and report where the import stopped.
+            if not report.processed:
+                raise
+            report.aborted = TodoImportError(row=report.processed + 1, error=e.message)
+
+        if batch:
+            await self._flush_batch(report, batch)
+            if on_progress is not None:
+                on_progress(report)
+        return report
+
+    async def _flush_batch(
+        self, report: TodoImportReport, batch: list[tuple[int, Todo]]
+    ) -> None:
+        existing_ids = await self.uow.todo_repo.get_existing_ids(
+            [todo.id for _, todo in batch]
+        )
+        new_todos: list[Todo] = []
+        for row_number, todo in batch:
+            if todo.id in existing_ids:
+                self._record_error(
+                    report, row_number, f'Todo with id {todo.id} already exists.'
+                )
+                continue
+            existing_ids.add(todo.id)
+            new_todos.append(todo)
+
+        created_todos = await self.uow.todo_repo.add_many(new_todos)
+        await self.uow.commit()
+        report.imported += len(created_todos)
+        report.batches += 1
+        if created_todos:
+            await _invalidate(self.cache, 'todo')
+
+    def _record_error(
+        self, report: TodoImportReport, row_number: int, error: str
+    ) -> None:
+        report.skipped += 1
+        if len(report.errors) < self.MAX_REPORTED_ERRORS:
+            report.errors.append(TodoImportError(row=row_number, error=error))
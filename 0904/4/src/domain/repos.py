@@ -1,58 +1,82 @@
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from typing import Protocol
 
 from src.domain.entity import Answer, Question, Todo
 
+Cursor = tuple[datetime, str]
+
 
 class TodoRepository(Protocol):
     async def add(self, todo: Todo) -> Todo: ...
 
-    async def get_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Todo], int]: ...
-
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Todo], int]: ...
+    async def add_many(self, todos: list[Todo]) -> list[Todo]: ...
 
     async def get(self, todo_id: str) -> Todo | None: ...
 
+    async def get_many(self, todo_ids: list[str]) -> list[Todo]: ...
+
+    async def get_existing_ids(self, todo_ids: list[str]) -> set[str]: ...
+
     async def get_any(self, todo_id: str) -> Todo | None: ...
 
     async def update(self, todo: Todo) -> Todo: ...
 
+    async def set_completed_many(
+        self, todo_ids: list[str], *, is_completed: bool
+    ) -> list[Todo]: ...
+
     async def delete(self, todo_id: str) -> None: ...
 
+    async def delete_many(self, todo_ids: list[str]) -> list[str]: ...
+
     async def hard_delete(self, todo_id: str) -> None: ...
 
+    async def hard_delete_many(self, todo_ids: list[str]) -> list[str]: ...
+
 
 class QuestionRepository(Protocol):
     async def add(self, question: Question) -> Question: ...
 
-    async def get_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Question], int]: ...
-
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Question], int]: ...
-
     async def get(self, question_id: str) -> Question | None: ...
 
+    async def get_thread(self, question_id: str) -> Question | None: ...
+
     async def get_any(self, question_id: str) -> Question | None: ...
 
     async def update(self, question: Question) -> Question: ...
 
     async def delete(self, question_id: str) -> None: ...
 
+    async def delete_many(self, question_ids: list[str]) -> list[str]: ...
+
     async def hard_delete(self, question_id: str) -> None: ...
 
+    async def hard_delete_many(self, question_ids: list[str]) -> list[str]: ...
+
 
 class AnswerRepository(Protocol):
     async def add(self, answer: Answer) -> Answer: ...
 
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Answer], int]: ...
+    async def get_answers_by_cursor(
+        self,
+        question_id: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Answer], int | None]: ...
+
+    async def get_replies_by_cursor(
+        self,
+        parent_id: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Answer], int | None]: ...
 
     async def get(self, answer_id: str) -> Answer | None: ...
 
@@ -62,8 +86,12 @@ class AnswerRepository(Protocol):
 
     async def delete(self, answer_id: str) -> None: ...
 
+    async def delete_many(self, answer_ids: list[str]) -> dict[str, str]: ...
+
     async def hard_delete(self, answer_id: str) -> None: ...
 
+    async def hard_delete_many(self, answer_ids: list[str]) -> dict[str, str]: ...
+
 
 class UnitOfWork(Protocol):
     todo_repo: TodoRepository
@@ -77,3 +105,5 @@ class UnitOfWork(Protocol):
     async def commit(self) -> None: ...
 
     async def rollback(self) -> None: ...
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None: ...
@@ -1,8 +1,22 @@
 from fastapi import APIRouter, Depends, Query, status
 
-from src.application.dtos import AdminDeletedItemsResponse
+from src.application.dtos import (
+    AdminBatchDeleteRequest,
+    AdminBatchDeleteResponse,
+    AdminDeletedItemsResponse,
+    AnswerViewResponse,
+    PaginatedResponse,
+    QuestionViewResponse,
+    TodoViewResponse,
+)
 from src.application.services import AdminService
-from src.infrastructure.core.dependencies import get_admin_service, verify_trusted_ip
+from src.infrastructure.core.dependencies import (
+    get_admin_read_service,
+    get_admin_service,
+    password_manager,
+    response_cache,
+    verify_trusted_ip,
+)
 
 router = APIRouter(
     prefix='/admin', tags=['admin'], dependencies=[Depends(verify_trusted_ip)]
@@ -13,11 +27,42 @@ router = APIRouter(
 async def get_list_deleted_items(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    admin_service: AdminService = Depends(get_admin_service),
+    admin_service: AdminService = Depends(get_admin_read_service),
 ) -> AdminDeletedItemsResponse:
     return await admin_service.get_deleted_items(skip=skip, limit=limit)
 
 
+@router.get(
+    '/deleted-items/{item_type}',
+    response_model=PaginatedResponse[
+        TodoViewResponse | QuestionViewResponse | AnswerViewResponse
+    ],
+)
+async def get_deleted_items_by_type(
+    item_type: str,
+    limit: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    include_total: bool = Query(True),
+    admin_service: AdminService = Depends(get_admin_read_service),
+) -> PaginatedResponse[TodoViewResponse | QuestionViewResponse | AnswerViewResponse]:
+    return await admin_service.get_deleted_items_by_cursor(
+        item_type=item_type,
+        limit=limit,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
+
+
+@router.get('/cache-stats')
+async def get_cache_stats() -> dict[str, dict[str, int | float]]:
+    return {
+        'response_cache': response_cache.stats(),
+        'password_cache': password_manager.stats(),
+    }
+
+
 @router.delete(
     '/soft-delete/{item_type}/{item_id}', status_code=status.HTTP_204_NO_CONTENT
 )
@@ -44,3 +89,21 @@ async def hard_delete_item(
         item_type=item_type,
         item_id=item_id,
     )
+
+
+@router.delete('/soft-delete/{item_type}', response_model=AdminBatchDeleteResponse)
+async def soft_delete_items(
+    item_type: str,
+    batch: AdminBatchDeleteRequest,
+    admin_service: AdminService = Depends(get_admin_service),
+) -> AdminBatchDeleteResponse:
+    return await admin_service.soft_delete_items(item_type=item_type, batch=batch)
+
+
+@router.delete('/hard-delete/{item_type}', response_model=AdminBatchDeleteResponse)
+async def hard_delete_items(
+    item_type: str,
+    batch: AdminBatchDeleteRequest,
+    admin_service: AdminService = Depends(get_admin_service),
+) -> AdminBatchDeleteResponse:
+    return await admin_service.hard_delete_items(item_type=item_type, batch=batch)
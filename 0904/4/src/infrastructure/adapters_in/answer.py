@@ -1,15 +1,25 @@
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from src.application.dtos import (
     AnswerCreateRequest,
     AnswerUpdateRequest,
     AnswerViewResponse,
     AuthRequest,
+    PaginatedResponse,
 )
 from src.application.services import AnswerService
-from src.infrastructure.core.dependencies import get_answer_service
+from src.infrastructure.adapters_in.responses import FastJSONResponse, FastJSONRoute
+from src.infrastructure.core.dependencies import (
+    get_answer_read_service,
+    get_answer_service,
+)
 
-router = APIRouter(prefix='/answer', tags=['answer'])
+router = APIRouter(
+    prefix='/answer',
+    tags=['answer'],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 @router.post(
@@ -27,11 +37,31 @@ async def add_answer(
 
 @router.get('/{answer_id}', response_model=AnswerViewResponse)
 async def get_single_answer(
-    answer_id: str, service: AnswerService = Depends(get_answer_service)
+    answer_id: str, service: AnswerService = Depends(get_answer_read_service)
 ) -> AnswerViewResponse:
     return await service.get_answer(answer_id=answer_id)
 
 
+@router.get(
+    '/{answer_id}/replies', response_model=PaginatedResponse[AnswerViewResponse]
+)
+async def get_replies(
+    answer_id: str,
+    limit: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    include_total: bool = Query(True),
+    service: AnswerService = Depends(get_answer_read_service),
+) -> PaginatedResponse[AnswerViewResponse]:
+    return await service.get_replies(
+        answer_id=answer_id,
+        limit=limit,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
+
+
 @router.put('/{answer_id}', response_model=AnswerViewResponse)
 async def update_answer(
     answer_id: str,
@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Message
+
+from src.application.dtos import PaginatedResponse, TodoImportReport, TodoViewResponse
+from src.application.services import TodoImportService
+from src.infrastructure.adapters_in.csv_import import iterate_in_chunks, read_csv_rows
+from src.infrastructure.adapters_in.purge import purge_expired
+from src.infrastructure.adapters_in.responses import FastJSONRoute
+from src.infrastructure.adapters_out.datebase.maintenance import (
+    rebuild_search_index,
+    repair_counters,
+)
+from src.infrastructure.adapters_out.datebase.uow import SqlAlchemyUnitOfWork
+from src.infrastructure.core.config import settings
+from src.infrastructure.core.database import AsyncSessionLocal
+from src.infrastructure.core.dependencies import (
+    hashing_pool,
+    password_manager,
+    response_cache,
+)
+
+
+async def run_repair_counters() -> None:
+    async with AsyncSessionLocal() as session, session.begin():
+        fixed = await repair_counters(session)
+    for name, count in fixed.items():
+        print(f'{name}: {count} row(s) repaired')
+
+
+async def run_rebuild_search_index() -> None:
+    async with AsyncSessionLocal() as session, session.begin():
+        rebuilt = await rebuild_search_index(session)
+    if not rebuilt:
+        print('nothing to rebuild: the search index is maintained by the database')
+    for name in rebuilt:
+        print(f'{name}: rebuilt')
+
+
+async def run_purge_deleted(
+    retention_days: float, batch_size: int, pause_seconds: float
+) -> None:
+    purged = await purge_expired(
+        AsyncSessionLocal,
+        retention=timedelta(days=retention_days),
+        batch_size=batch_size,
+        pause_seconds=pause_seconds,
+    )
+    for name, count in purged.items():
+        print(f'{name}: {count} row(s) purged')
+
+
+def print_import_progress(report: TodoImportReport) -> None:
+    print(
+        f'batch {report.batches}: {report.processed} row(s) read, '
+        f'{report.imported} imported, {report.skipped} skipped'
+    )
+
+
+async def run_import_todos(
+    path: str, *, password: str, batch_size: int, creator_ip: str
+) -> None:
+    try:
+        with open(path, encoding='utf-8-sig', newline='') as stream:
+            async with SqlAlchemyUnitOfWork(AsyncSessionLocal) as uow:
+                service = TodoImportService(
+                    uow=uow, password_manager=password_manager, cache=response_cache
+                )
+                report = await service.import_todos(
+                    iterate_in_chunks(
+                        read_csv_rows(stream, fieldnames=settings.FIELDNAMES),
+                        chunk_size=batch_size,
+                    ),
+                    password=password,
+                    creator_ip=creator_ip,
+                    batch_size=batch_size,
+                    on_progress=print_import_progress,
+                )
+    finally:
+        await response_cache.close()
+        hashing_pool.shutdown()
+
+    for error in report.errors:
+        print(f'row {error.row}: {error.error}')
+    if report.aborted is not None:
+        print(f'stopped at row {report.aborted.row}: {report.aborted.error}')
+    print(
+        f'done: {report.imported} imported, {report.skipped} skipped '
+        f'of {report.processed} row(s)'
+    )
+
+
+async def _get(app: ASGIApp, path: str) -> bytes:
+    body = []
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        if message['type'] == 'http.response.body':
+            body.append(message['body'])
+
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': [],
+        'client': ('127.0.0.1', 0),
+        'server': ('testserver', 80),
+    }
+    await app(scope, receive, send)
+    return b''.join(body)
+
+
+def _bench_app(route_class: type[APIRoute], page: BaseModel) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get('/page', response_model=type(page))
+    async def get_page() -> BaseModel:
+        return page
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def run_bench_serialization(items: int, rounds: int) -> None:
+    now = datetime.now(UTC)
+    page = PaginatedResponse[TodoViewResponse](
+        total_items=items,
+        items=[
+            TodoViewResponse(
+                id=str(uuid.uuid4()),
+                task=f'task {i}',
+                is_completed=i % 2 == 0,
+                creator_ip='192.168.0.1',
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(items)
+        ],
+        page=1,
+        page_size=items,
+    )
+    # Both apps run the full FastAPI request path; only the route class differs.
+    apps = {
+        'APIRoute (FastAPI default)': _bench_app(APIRoute, page),
+        'FastJSONRoute': _bench_app(FastJSONRoute, page),
+    }
+
+    async def measure(app: ASGIApp) -> float:
+        timings = []
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await _get(app, '/page')
+            timings.append((time.perf_counter() - started) / rounds)
+        return min(timings)
+
+    async def run() -> None:
+        bodies = {name: await _get(app, '/page') for name, app in apps.items()}
+        if len(set(bodies.values())) != 1:
+            print('warning: the routes render different bodies')
+        for name, app in apps.items():
+            seconds = await measure(app)
+            print(
+                f'{name:<30} {seconds * 1e6:9.1f} us/page '
+                f'{seconds * 1e6 / items:7.2f} us/item'
+            )
+
+    asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m src.infrastructure.adapters_in.cli'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser(
+        'repair-counters',
+        help='Recalculate denormalized answer/reply/item counters from the tables.',
+    )
+
+    commands.add_parser(
+        'rebuild-search-index',
+        help='Repopulate the SQLite FTS tables after a VACUUM or table rebuild.',
+    )
+
+    purge = commands.add_parser(
+        'purge-deleted',
+        help='Hard-delete soft-deleted rows older than the retention period.',
+    )
+    purge.add_argument(
+        '--retention-days', type=float, default=settings.PURGE_RETENTION_DAYS
+    )
+    purge.add_argument('--batch-size', type=int, default=settings.PURGE_BATCH_SIZE)
+    purge.add_argument(
+        '--pause', type=float, default=settings.PURGE_BATCH_PAUSE_SECONDS
+    )
+
+    import_todos = commands.add_parser(
+        'import-todos',
+        help='Bulk insert todos from a CSV file with the FIELDNAMES columns.',
+    )
+    import_todos.add_argument('path', nargs='?', default=settings.CSV_FILE)
+    import_todos.add_argument('--password', required=True)
+    import_todos.add_argument(
+        '--batch-size', type=int, default=settings.IMPORT_BATCH_SIZE
+    )
+    import_todos.add_argument('--creator-ip', default='127.0.0.1')
+
+    bench = commands.add_parser(
+        'bench-serialization',
+        help='Time JSON rendering of a todo page through each response path.',
+    )
+    bench.add_argument('--items', type=int, default=100)
+    bench.add_argument('--rounds', type=int, default=200)
+
+    args = parser.parse_args()
+    if args.command == 'repair-counters':
+        asyncio.run(run_repair_counters())
+    elif args.command == 'rebuild-search-index':
+        asyncio.run(run_rebuild_search_index())
+    elif args.command == 'purge-deleted':
+        asyncio.run(run_purge_deleted(args.retention_days, args.batch_size, args.pause))
+    elif args.command == 'import-todos':
+        asyncio.run(
+            run_import_todos(
+                args.path,
+                password=args.password,
+                batch_size=args.batch_size,
+                creator_ip=args.creator_ip,
+            )
+        )
+    elif args.command == 'bench-serialization':
+        run_bench_serialization(args.items, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
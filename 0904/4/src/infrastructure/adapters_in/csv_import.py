@@ -0,0 +1,50 @@
+import csv
+from collections.abc import AsyncIterator, Iterator
+from itertools import islice
+from typing import IO
+
+from starlette.concurrency import run_in_threadpool
+
+from src.domain.exceptions import ValidationError
+
+
+def read_csv_rows(
+    stream: IO[str], *, fieldnames: list[str], required: tuple[str, ...] = ('task',)
+) -> Iterator[dict[str, str]]:
+    try:
+        reader = csv.DictReader(stream)
+        header = reader.fieldnames or []
+        missing = [name for name in required if name not in header]
+        if missing:
+            raise ValidationError(
+                f'CSV header is missing column(s): {", ".join(missing)}.'
+            )
+        for row in reader:
+            yield {name: row[name] for name in fieldnames if row.get(name) is not None}
+    except UnicodeDecodeError:
+        raise ValidationError('CSV file must be UTF-8 encoded.')
+    except csv.Error as e:
+        raise ValidationError(f'Malformed CSV: {e}')
+
+
+async def iterate_in_chunks(
+    rows: Iterator[dict[str, str]], *, chunk_size: int
+) -> AsyncIterator[dict[str, str]]:
+    # Read and parse in a worker thread, one hop per chunk instead of per row.
+    def next_chunk() -> tuple[list[dict[str, str]], Exception | None]:
+        chunk: list[dict[str, str]] = []
+        try:
+            for row in islice(rows, chunk_size):
+                chunk.append(row)
+        except Exception as e:
+            return chunk, e
+        return chunk, None
+
+    while True:
+        chunk, error = await run_in_threadpool(next_chunk)
+        for row in chunk:
+            yield row
+        if error is not None:
+            raise error
+        if len(chunk) < chunk_size:
+            return
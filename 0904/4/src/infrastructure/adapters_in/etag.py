@@ -0,0 +1,39 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(body: bytes) -> str:
+    digest = hashlib.blake2b(body, digest_size=16)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(
+        candidate.strip().removeprefix('W/') == opaque_tag
+        for candidate in if_none_match.split(',')
+    )
+
+
+def conditional_get(request: Request, response: Response) -> Response:
+    # Streamed and error responses pass through untagged.
+    if (
+        request.method != 'GET'
+        or response.status_code != status.HTTP_200_OK
+        or not hasattr(response, 'body')
+    ):
+        return response
+    etag = make_etag(response.body)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and _matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+            background=response.background,
+        )
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,62 @@
+import csv
+import io
+import os
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+ExportFormat = Literal['ndjson', 'csv']
+
+_MEDIA_TYPES: dict[str, str] = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+async def _ndjson_chunks(
+    batches: AsyncIterator[list[BaseModel]], model: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    adapter = TypeAdapter(model)
+    async for batch in batches:
+        yield b''.join(adapter.dump_json(item) + b'\n' for item in batch)
+
+
+async def _csv_chunks(
+    batches: AsyncIterator[list[BaseModel]], fieldnames: list[str]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    include = set(fieldnames)
+    async for batch in batches:
+        writer.writerows(
+            item.model_dump(mode='json', include=include) for item in batch
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_response(
+    batches: AsyncIterator[list[BaseModel]],
+    *,
+    export_format: ExportFormat,
+    model: type[BaseModel],
+    fieldnames: list[str],
+    filename: str,
+) -> StreamingResponse:
+    if export_format == 'csv':
+        content = _csv_chunks(batches, fieldnames)
+    else:
+        content = _ndjson_chunks(batches, model)
+        filename = f'{os.path.splitext(filename)[0]}.ndjson'
+
+    return StreamingResponse(
+        content,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
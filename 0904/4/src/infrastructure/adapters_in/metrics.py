@@ -0,0 +1,57 @@
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructure.adapters_out.datebase.uow import SqlAlchemyUnitOfWork
+from src.infrastructure.core.dependencies import (
+    password_manager,
+    response_cache,
+    verify_trusted_ip,
+)
+from src.infrastructure.core.metrics import format_family, render_metrics
+
+router = APIRouter(tags=['metrics'], dependencies=[Depends(verify_trusted_ip)])
+
+
+def _cache_metrics() -> Iterator[str]:
+    caches = {
+        'response': response_cache.stats(),
+        'password': password_manager.stats(),
+    }
+    families = (
+        ('app_cache_hits_total', 'hits', 'counter', 'Cache hits since startup.'),
+        ('app_cache_misses_total', 'misses', 'counter', 'Cache misses since startup.'),
+        ('app_cache_size', 'size', 'gauge', 'Entries currently held in the cache.'),
+    )
+    for name, stat, kind, documentation in families:
+        samples = [
+            f'{name}{{cache="{cache}"}} {stats[stat]}'
+            for cache, stats in caches.items()
+            if stat in stats
+        ]
+        if samples:
+            yield from format_family(name, kind, documentation, samples)
+
+
+def _uow_counters() -> Iterator[str]:
+    counters = {
+        'app_uow_commits_total': (
+            'Unit-of-work commits issued.',
+            SqlAlchemyUnitOfWork.commit_count,
+        ),
+        'app_uow_skipped_commits_total': (
+            'Unit-of-work commits skipped because nothing was written.',
+            SqlAlchemyUnitOfWork.skipped_commit_count,
+        ),
+    }
+    for name, (documentation, value) in counters.items():
+        yield from format_family(name, 'counter', documentation, [f'{name} {value}'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    content = render_metrics() + '\n'.join([*_cache_metrics(), *_uow_counters()])
+    return PlainTextResponse(
+        content + '\n', media_type='text/plain; version=0.0.4; charset=utf-8'
+    )
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.adapters_out.datebase.maintenance import (
+    purge_answers,
+    purge_questions,
+    purge_todos,
+)
+
+log = logging.getLogger(__name__)
+
+PURGES = {
+    'todo': purge_todos,
+    'question': purge_questions,
+    'answer': purge_answers,
+}
+
+
+async def purge_expired(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    retention: timedelta,
+    batch_size: int,
+    pause_seconds: float,
+) -> dict[str, int]:
+    cutoff = datetime.now(UTC) - retention
+    purged = dict.fromkeys(PURGES, 0)
+    for entity, purge in PURGES.items():
+        while True:
+            async with session_factory() as session, session.begin():
+                count = await purge(session, cutoff=cutoff, batch_size=batch_size)
+            purged[entity] += count
+            if not count:
+                break
+            await asyncio.sleep(pause_seconds)
+    return purged
+
+
+async def run_purge_worker(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    interval_seconds: float,
+    retention: timedelta,
+    batch_size: int,
+    pause_seconds: float,
+) -> None:
+    while True:
+        try:
+            purged = await purge_expired(
+                session_factory,
+                retention=retention,
+                batch_size=batch_size,
+                pause_seconds=pause_seconds,
+            )
+            if any(purged.values()):
+                log.info(f'Purged soft-deleted rows: {purged}')
+        except Exception:
+            log.exception('Purging soft-deleted rows failed.')
+        await asyncio.sleep(interval_seconds)
@@ -1,16 +1,30 @@
 from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from src.application.dtos import (
+    AnswerViewResponse,
     AuthRequest,
     PaginatedResponse,
     QuestionCreateRequest,
     QuestionUpdateRequest,
     QuestionViewResponse,
 )
-from src.application.services import QuestionService
-from src.infrastructure.core.dependencies import get_question_service
+from src.application.services import AnswerService, QuestionService
+from src.infrastructure.adapters_in.export import ExportFormat, export_response
+from src.infrastructure.adapters_in.responses import FastJSONResponse, FastJSONRoute
+from src.infrastructure.core.config import settings
+from src.infrastructure.core.dependencies import (
+    get_answer_read_service,
+    get_question_read_service,
+    get_question_service,
+)
 
-router = APIRouter(prefix='/question', tags=['question'])
+router = APIRouter(
+    prefix='/question',
+    tags=['question'],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 @router.post(
@@ -30,16 +44,76 @@ async def add_question(
 async def get_questions(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    service: QuestionService = Depends(get_question_service),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    include_total: bool = Query(True),
+    service: QuestionService = Depends(get_question_read_service),
 ) -> PaginatedResponse[QuestionViewResponse]:
-    return await service.get_questions(skip=skip, limit=limit)
+    return await service.get_questions(
+        skip=skip,
+        limit=limit,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
+
+
+@router.get('/search', response_model=PaginatedResponse[QuestionViewResponse])
+async def search_questions(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    include_total: bool = Query(True),
+    service: QuestionService = Depends(get_question_read_service),
+) -> PaginatedResponse[QuestionViewResponse]:
+    return await service.search_questions(
+        query=q, skip=skip, limit=limit, include_total=include_total
+    )
+
+
+@router.get('/export', response_class=StreamingResponse)
+async def export_questions(
+    export_format: ExportFormat = Query('ndjson', alias='format'),
+    service: QuestionService = Depends(get_question_read_service),
+) -> StreamingResponse:
+    return export_response(
+        service.export_questions(batch_size=settings.EXPORT_BATCH_SIZE),
+        export_format=export_format,
+        model=QuestionViewResponse,
+        fieldnames=settings.QUESTION_FIELDNAMES,
+        filename=settings.QUESTION_CSV_FILE,
+    )
 
 
 @router.get('/{question_id}', response_model=QuestionViewResponse)
 async def get_single_question(
-    question_id: str, service: QuestionService = Depends(get_question_service)
+    question_id: str,
+    include_answers: bool = Query(True),
+    service: QuestionService = Depends(get_question_read_service),
 ) -> QuestionViewResponse:
-    return await service.get_question(question_id=question_id)
+    return await service.get_question(
+        question_id=question_id, include_answers=include_answers
+    )
+
+
+@router.get(
+    '/{question_id}/answers', response_model=PaginatedResponse[AnswerViewResponse]
+)
+async def get_question_answers(
+    question_id: str,
+    limit: int = Query(10, ge=1, le=100),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    include_total: bool = Query(True),
+    service: AnswerService = Depends(get_answer_read_service),
+) -> PaginatedResponse[AnswerViewResponse]:
+    return await service.get_answers(
+        question_id=question_id,
+        limit=limit,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
 
 
 @router.put('/{question_id}', response_model=QuestionViewResponse)
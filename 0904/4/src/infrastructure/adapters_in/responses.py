@@ -0,0 +1,70 @@
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pydantic_core
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from src.infrastructure.adapters_in.etag import conditional_get
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return pydantic_core.to_json(content)
+
+
+def _dump_directly(
+    endpoint: Callable[..., Any], adapter: TypeAdapter, status_code: int | None
+) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        content = await endpoint(*args, **kwargs)
+        if not isinstance(content, BaseModel):
+            return content
+
+        sub_response: Response | None = kwargs.get('response')
+        return Response(
+            content=adapter.dump_json(content),
+            status_code=(sub_response and sub_response.status_code)
+            or status_code
+            or 200,
+            headers=sub_response.headers if sub_response is not None else None,
+            media_type='application/json',
+        )
+
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_model = kwargs.get('response_model')
+        if (
+            inspect.iscoroutinefunction(endpoint)
+            and isinstance(response_model, type)
+            and issubclass(response_model, BaseModel)
+        ):
+            endpoint = _dump_directly(
+                endpoint, TypeAdapter(response_model), kwargs.get('status_code')
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        # Tag GET bodies after rendering, so the ETag costs a hash of bytes that
+        # were produced anyway rather than a second serialization.
+        async def tagged_handler(request: Request) -> Response:
+            return conditional_get(request, await handler(request))
+
+        return tagged_handler
@@ -1,16 +1,45 @@
-from fastapi import APIRouter, Depends, Query, Request, status
+import io
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from src.application.dtos import (
     AuthRequest,
     PaginatedResponse,
+    TodoBatchAuthRequest,
+    TodoBatchCreateRequest,
+    TodoBatchResponse,
     TodoCreateRequest,
+    TodoImportReport,
     TodoUpdateRequest,
     TodoViewResponse,
 )
-from src.application.services import TodoService
-from src.infrastructure.core.dependencies import get_todo_service
+from src.application.services import TodoImportService, TodoService
+from src.infrastructure.adapters_in.csv_import import iterate_in_chunks, read_csv_rows
+from src.infrastructure.adapters_in.export import ExportFormat, export_response
+from src.infrastructure.adapters_in.responses import FastJSONResponse, FastJSONRoute
+from src.infrastructure.core.config import settings
+from src.infrastructure.core.dependencies import (
+    get_todo_import_service,
+    get_todo_read_service,
+    get_todo_service,
+)
 
-router = APIRouter(prefix='/todo', tags=['todo'])
+router = APIRouter(
+    prefix='/todo',
+    tags=['todo'],
+    route_class=FastJSONRoute,
+    default_response_class=FastJSONResponse,
+)
 
 
 @router.post('/', response_model=TodoViewResponse, status_code=status.HTTP_201_CREATED)
@@ -22,18 +51,87 @@ async def add_todo(
     return await service.create_todo(todo_dto=todo_dto, creator_ip=request.client.host)
 
 
+@router.post('/batch', response_model=TodoBatchResponse)
+async def add_todos(
+    batch: TodoBatchCreateRequest,
+    request: Request,
+    service: TodoService = Depends(get_todo_service),
+) -> TodoBatchResponse:
+    return await service.create_todos(batch=batch, creator_ip=request.client.host)
+
+
+@router.post('/batch/complete', response_model=TodoBatchResponse)
+async def mark_todos_as_complete(
+    batch: TodoBatchAuthRequest, service: TodoService = Depends(get_todo_service)
+) -> TodoBatchResponse:
+    return await service.complete_todos(batch=batch)
+
+
+@router.post('/import', response_model=TodoImportReport)
+async def import_todos(
+    request: Request,
+    file: UploadFile = File(...),
+    password: str = Form(...),
+    batch_size: int = Query(settings.IMPORT_BATCH_SIZE, ge=1, le=10000),
+    service: TodoImportService = Depends(get_todo_import_service),
+) -> TodoImportReport:
+    stream = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+    try:
+        return await service.import_todos(
+            iterate_in_chunks(
+                read_csv_rows(stream, fieldnames=settings.FIELDNAMES),
+                chunk_size=batch_size,
+            ),
+            password=password,
+            creator_ip=request.client.host,
+            batch_size=batch_size,
+        )
+    finally:
+        stream.detach()
+
+
+@router.delete('/batch', response_model=TodoBatchResponse)
+async def delete_todos(
+    batch: TodoBatchAuthRequest, service: TodoService = Depends(get_todo_service)
+) -> TodoBatchResponse:
+    return await service.delete_todos(batch=batch)
+
+
 @router.get('/', response_model=PaginatedResponse[TodoViewResponse])
 async def get_todos(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    service: TodoService = Depends(get_todo_service),
+    after: str | None = Query(None),
+    before: str | None = Query(None),
+    include_total: bool = Query(True),
+    service: TodoService = Depends(get_todo_read_service),
 ) -> PaginatedResponse[TodoViewResponse]:
-    return await service.get_todos(skip=skip, limit=limit)
+    return await service.get_todos(
+        skip=skip,
+        limit=limit,
+        after=after,
+        before=before,
+        include_total=include_total,
+    )
+
+
+@router.get('/export', response_class=StreamingResponse)
+async def export_todos(
+    export_format: ExportFormat = Query('ndjson', alias='format'),
+    service: TodoService = Depends(get_todo_read_service),
+) -> StreamingResponse:
+    return export_response(
+        service.export_todos(batch_size=settings.EXPORT_BATCH_SIZE),
+        export_format=export_format,
+        model=TodoViewResponse,
+        fieldnames=settings.FIELDNAMES,
+        filename=settings.CSV_FILE,
+    )
 
 
 @router.get('/{todo_id}', response_model=TodoViewResponse)
 async def get_single_todo(
-    todo_id: str, service: TodoService = Depends(get_todo_service)
+    todo_id: str, service: TodoService = Depends(get_todo_read_service)
 ) -> TodoViewResponse:
     return await service.get_todo(todo_id=todo_id)
 
@@ -0,0 +1,170 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel, ValidationError
+
+from src.application.ports import Cache
+from src.domain.repos import UnitOfWork
+
+
+class InMemoryCache(Cache):
+    def __init__(self, *, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        self._entries.pop(key, None)
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': _hit_ratio(self.hits, self.misses),
+            'size': len(self._entries),
+        }
+
+
+class CommitBoundCache(Cache):
+    # Deleting before the commit lets a concurrent read re-cache the old row,
+    # so deletes wait for the unit of work's after-commit hook.
+    def __init__(self, cache: Cache, uow: UnitOfWork):
+        self.cache = cache
+        self._pending: set[str] = set()
+        uow.after_commit(self._flush)
+
+    async def get(self, key: str) -> Any | None:
+        return await self.cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.cache.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        self._pending.update(keys)
+
+    async def _flush(self) -> None:
+        keys, self._pending = self._pending, set()
+        if keys:
+            await self.cache.delete(*keys)
+
+
+class RedisCache(Cache):
+    def __init__(
+        self,
+        client: Any,
+        *,
+        ttl_seconds: float,
+        models: Iterable[type[BaseModel]],
+        prefix: str = 'cache:',
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.models = {model.__name__: model for model in models}
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_url(
+        cls, url: str, *, ttl_seconds: float, models: Iterable[type[BaseModel]]
+    ) -> 'RedisCache':
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), ttl_seconds=ttl_seconds, models=models)
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self.client.get(self.prefix + key)
+        value = None if raw is None else self._loads(raw)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.client.set(
+            self.prefix + key, self._dumps(value), px=int(self.ttl_seconds * 1000)
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    # Values are stored as '<type tag>\n<JSON>' and only decoded into the
+    # registered models, so nothing read back from Redis is ever executed.
+    def _dumps(self, value: Any) -> bytes:
+        if isinstance(value, str):
+            return b'str\n' + value.encode()
+        if isinstance(value, BaseModel) and type(value).__name__ in self.models:
+            return f'{type(value).__name__}\n'.encode() + pydantic_core.to_json(
+                _raw_fields(value)
+            )
+        raise TypeError(f'Cannot cache {type(value).__name__} values in Redis.')
+
+    def _loads(self, raw: bytes) -> Any | None:
+        tag, _, payload = raw.partition(b'\n')
+        if tag == b'str':
+            return payload.decode()
+        model = self.models.get(tag.decode())
+        if model is None:
+            return None
+        try:
+            return model.model_validate_json(payload)
+        except ValidationError:
+            # Written by a build with a different schema; treat as a miss.
+            return None
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': _hit_ratio(self.hits, self.misses),
+        }
+
+
+def _raw_fields(value: Any) -> Any:
+    # model_dump would apply the field serializers (e.g. IP masking), and they
+    # would run a second time when the cached model is rendered.
+    if isinstance(value, BaseModel):
+        return {
+            name: _raw_fields(getattr(value, name)) for name in type(value).model_fields
+        }
+    if isinstance(value, list):
+        return [_raw_fields(item) for item in value]
+    return value
+
+
+def _hit_ratio(hits: int, misses: int) -> float:
+    lookups = hits + misses
+    return hits / lookups if lookups else 0.0
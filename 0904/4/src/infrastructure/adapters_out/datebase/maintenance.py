@@ -0,0 +1,176 @@
+from datetime import datetime
+
+from sqlalchemy import Select, case, delete, exists, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from src.infrastructure.adapters_out.datebase.models import (
+    AnswerTable,
+    ItemCountTable,
+    QuestionTable,
+    TodoTable,
+)
+from src.infrastructure.adapters_out.datebase.repos import _adjust_count
+
+
+async def repair_counters(session: AsyncSession) -> dict[str, int]:
+    live_answers = (
+        select(func.count(AnswerTable.id))
+        .where(
+            AnswerTable.question_id == QuestionTable.id,
+            AnswerTable.deleted_at.is_(None),
+        )
+        .scalar_subquery()
+    )
+    question_result = await session.execute(
+        update(QuestionTable)
+        .where(QuestionTable.answer_count != live_answers)
+        .values(answer_count=live_answers, updated_at=QuestionTable.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    replies = aliased(AnswerTable, name='replies')
+    live_replies = (
+        select(func.count(replies.id))
+        .where(replies.parent_id == AnswerTable.id, replies.deleted_at.is_(None))
+        .scalar_subquery()
+    )
+    answer_result = await session.execute(
+        update(AnswerTable)
+        .where(AnswerTable.reply_count != live_replies)
+        .values(reply_count=live_replies, updated_at=AnswerTable.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+    item_counts_fixed = 0
+    for table in (TodoTable, QuestionTable, AnswerTable):
+        live, deleted = (
+            await session.execute(
+                select(
+                    func.count(table.id) - func.count(table.deleted_at),
+                    func.count(table.deleted_at),
+                )
+            )
+        ).one()
+        item_count = await session.get(ItemCountTable, table.__tablename__)
+        if item_count is None:
+            item_count = ItemCountTable(entity=table.__tablename__)
+            session.add(item_count)
+        if (item_count.live_count, item_count.deleted_count) != (live, deleted):
+            item_count.live_count = live
+            item_count.deleted_count = deleted
+            item_counts_fixed += 1
+    await session.flush()
+
+    return {
+        'question.answer_count': question_result.rowcount,
+        'answer.reply_count': answer_result.rowcount,
+        'item_count': item_counts_fixed,
+    }
+
+
+async def rebuild_search_index(session: AsyncSession) -> list[str]:
+    if session.get_bind().dialect.name != 'sqlite':
+        return []
+
+    rebuilt = []
+    for fts_table in ('question_fts', 'answer_fts'):
+        await session.execute(
+            text(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        )
+        rebuilt.append(fts_table)
+    return rebuilt
+
+
+async def _claim_batch(
+    session: AsyncSession, query: Select, batch_size: int
+) -> list[str]:
+    # Concurrent purgers skip rows another worker has already locked.
+    return list(
+        await session.scalars(query.limit(batch_size).with_for_update(skip_locked=True))
+    )
+
+
+async def purge_todos(
+    session: AsyncSession, *, cutoff: datetime, batch_size: int
+) -> int:
+    todo_ids = await _claim_batch(
+        session,
+        select(TodoTable.id)
+        .where(TodoTable.deleted_at < cutoff)
+        .order_by(TodoTable.deleted_at),
+        batch_size,
+    )
+    if not todo_ids:
+        return 0
+
+    result = await session.execute(
+        delete(TodoTable)
+        .where(TodoTable.id.in_(todo_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await _adjust_count(session, TodoTable.__tablename__, deleted=-result.rowcount)
+    return result.rowcount
+
+
+async def purge_questions(
+    session: AsyncSession, *, cutoff: datetime, batch_size: int
+) -> int:
+    question_ids = await _claim_batch(
+        session,
+        select(QuestionTable.id)
+        .where(QuestionTable.deleted_at < cutoff)
+        .order_by(QuestionTable.deleted_at),
+        batch_size,
+    )
+    if not question_ids:
+        return 0
+
+    live_answers, deleted_answers = (
+        await session.execute(
+            select(
+                func.count(case((AnswerTable.deleted_at.is_(None), 1))),
+                func.count(AnswerTable.deleted_at),
+            ).where(AnswerTable.question_id.in_(question_ids))
+        )
+    ).one()
+    await session.execute(
+        delete(AnswerTable)
+        .where(AnswerTable.question_id.in_(question_ids))
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(
+        delete(QuestionTable)
+        .where(QuestionTable.id.in_(question_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await _adjust_count(
+        session, AnswerTable.__tablename__, live=-live_answers, deleted=-deleted_answers
+    )
+    await _adjust_count(session, QuestionTable.__tablename__, deleted=-result.rowcount)
+    return result.rowcount
+
+
+async def purge_answers(
+    session: AsyncSession, *, cutoff: datetime, batch_size: int
+) -> int:
+    replies = aliased(AnswerTable, name='replies')
+    answer_ids = await _claim_batch(
+        session,
+        select(AnswerTable.id)
+        .where(
+            AnswerTable.deleted_at < cutoff,
+            ~exists().where(replies.parent_id == AnswerTable.id),
+        )
+        .order_by(AnswerTable.deleted_at),
+        batch_size,
+    )
+    if not answer_ids:
+        return 0
+
+    result = await session.execute(
+        delete(AnswerTable)
+        .where(AnswerTable.id.in_(answer_ids))
+        .execution_options(synchronize_session=False)
+    )
+    await _adjust_count(session, AnswerTable.__tablename__, deleted=-result.rowcount)
+    return result.rowcount
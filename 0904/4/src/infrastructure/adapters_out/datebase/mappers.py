@@ -1,6 +1,12 @@
 from datetime import UTC
+from typing import Any
 
-from sqlalchemy import inspect
+from sqlalchemy import Row, inspect
+from src.application.dtos import (
+    AnswerViewResponse,
+    QuestionViewResponse,
+    TodoViewResponse,
+)
 from src.domain.entity import Answer, Question, Todo
 from src.infrastructure.adapters_out.datebase.models import (
     AnswerTable,
@@ -10,6 +16,16 @@ from src.infrastructure.adapters_out.datebase.models import (
 
 
 class TodoMapper:
+    VIEW_COLUMNS = (
+        TodoTable.id,
+        TodoTable.task,
+        TodoTable.due_date,
+        TodoTable.is_completed,
+        TodoTable.creator_ip,
+        TodoTable.created_at,
+        TodoTable.updated_at,
+    )
+
     @staticmethod
     def to_domain(todo_table: TodoTable) -> Todo:
         return Todo(
@@ -23,6 +39,18 @@ class TodoMapper:
             password_hash=todo_table.password_hash,
         )
 
+    @staticmethod
+    def to_view(row: Row) -> TodoViewResponse:
+        return TodoViewResponse.model_construct(
+            id=row.id,
+            task=row.task,
+            due_date=row.due_date,
+            is_completed=row.is_completed,
+            creator_ip=row.creator_ip,
+            created_at=row.created_at.replace(tzinfo=UTC),
+            updated_at=row.updated_at.replace(tzinfo=UTC),
+        )
+
     @staticmethod
     def to_table(todo: Todo) -> TodoTable:
         return TodoTable(
@@ -34,14 +62,36 @@ class TodoMapper:
             password_hash=todo.password_hash,
         )
 
+    @staticmethod
+    def to_values(todo: Todo) -> dict[str, Any]:
+        return {
+            'id': todo.id,
+            'task': todo.task,
+            'due_date': todo.due_date,
+            'is_completed': todo.is_completed,
+            'creator_ip': todo.creator_ip,
+            'password_hash': todo.password_hash,
+        }
+
     @staticmethod
     def update_table_from_domain(todo: Todo, todo_table: TodoTable) -> None:
         todo_table.task = todo.task
         todo_table.due_date = todo.due_date
         todo_table.is_completed = todo.is_completed
+        todo_table.password_hash = todo.password_hash
 
 
 class QuestionMapper:
+    VIEW_COLUMNS = (
+        QuestionTable.id,
+        QuestionTable.subject,
+        QuestionTable.content,
+        QuestionTable.creator_ip,
+        QuestionTable.created_at,
+        QuestionTable.updated_at,
+        QuestionTable.answer_count,
+    )
+
     @staticmethod
     def to_domain(question_table: QuestionTable) -> Question:
         domain_answers = []
@@ -65,6 +115,18 @@ class QuestionMapper:
             password_hash=question_table.password_hash,
         )
 
+    @staticmethod
+    def to_view(row: Row) -> QuestionViewResponse:
+        return QuestionViewResponse.model_construct(
+            id=row.id,
+            subject=row.subject,
+            content=row.content,
+            creator_ip=row.creator_ip,
+            created_at=row.created_at.replace(tzinfo=UTC),
+            updated_at=row.updated_at.replace(tzinfo=UTC),
+            answer_count=row.answer_count,
+        )
+
     @staticmethod
     def to_table(question: Question) -> QuestionTable:
         return QuestionTable(
@@ -81,9 +143,22 @@ class QuestionMapper:
     ) -> None:
         question_table.subject = question.subject
         question_table.content = question.content
+        question_table.password_hash = question.password_hash
 
 
 class AnswerMapper:
+    VIEW_COLUMNS = (
+        AnswerTable.id,
+        AnswerTable.content,
+        AnswerTable.question_id,
+        AnswerTable.creator_ip,
+        AnswerTable.parent_id,
+        AnswerTable.created_at,
+        AnswerTable.updated_at,
+        AnswerTable.deleted_at,
+        AnswerTable.reply_count,
+    )
+
     @staticmethod
     def to_domain(answer_table: AnswerTable) -> Answer:
         domain_replies = []
@@ -111,6 +186,21 @@ class AnswerMapper:
             password_hash=answer_table.password_hash,
         )
 
+    @staticmethod
+    def to_view(row: Row) -> AnswerViewResponse:
+        return AnswerViewResponse.model_construct(
+            id=row.id,
+            content=row.content,
+            question_id=row.question_id,
+            creator_ip=row.creator_ip,
+            parent_id=row.parent_id,
+            created_at=row.created_at.replace(tzinfo=UTC),
+            updated_at=row.updated_at.replace(tzinfo=UTC),
+            deleted_at=row.deleted_at.replace(tzinfo=UTC) if row.deleted_at else None,
+            replies=[],
+            reply_count=row.reply_count,
+        )
+
     @staticmethod
     def to_table(answer: Answer) -> AnswerTable:
         return AnswerTable(
@@ -125,3 +215,4 @@ class AnswerMapper:
     @staticmethod
     def update_table_from_domain(answer: Answer, answer_table: AnswerTable) -> None:
         answer_table.content = answer.content
+        answer_table.password_hash = answer.password_hash
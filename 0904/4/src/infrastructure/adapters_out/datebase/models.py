@@ -4,16 +4,27 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
-    and_,
     func,
-    select,
     text,
 )
-from sqlalchemy.orm import aliased, column_property, relationship
+from sqlalchemy.dialects.sqlite import DATETIME as SQLITE_DATETIME
+from sqlalchemy.orm import relationship
 from src.infrastructure.core.database import Base
 
+# SQLite stores CURRENT_TIMESTAMP without fractional seconds; bind keyset cursor
+# values in the same format so string comparison matches the stored rows.
+CreatedAt = DateTime(timezone=True).with_variant(
+    SQLITE_DATETIME(
+        storage_format='%(year)04d-%(month)02d-%(day)02d '
+        '%(hour)02d:%(minute)02d:%(second)02d'
+    ),
+    'sqlite',
+)
+
 
 class TodoTable(Base):
     __tablename__ = 'todo'
@@ -24,9 +35,7 @@ class TodoTable(Base):
     creator_ip = Column(String, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
 
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
+    created_at = Column(CreatedAt, nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -35,6 +44,24 @@ class TodoTable(Base):
     )
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
+    __table_args__ = (
+        Index('ix_todo_created_at_id', 'created_at', 'id'),
+        Index(
+            'ix_todo_deleted_created_at_id',
+            'created_at',
+            'id',
+            sqlite_where=text('deleted_at IS NOT NULL'),
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
+    )
+
+
+class ItemCountTable(Base):
+    __tablename__ = 'item_count'
+    entity = Column(String, primary_key=True)
+    live_count = Column(Integer, nullable=False, default=0)
+    deleted_count = Column(Integer, nullable=False, default=0)
+
 
 class AnswerTable(Base):
     __tablename__ = 'answer'
@@ -43,9 +70,7 @@ class AnswerTable(Base):
     creator_ip = Column(String, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
 
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
+    created_at = Column(CreatedAt, nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -62,12 +87,14 @@ class AnswerTable(Base):
     parent_id = Column(
         String, ForeignKey('answer.id', ondelete='CASCADE'), nullable=True
     )
+    reply_count = Column(Integer, nullable=False, default=0, server_default='0')
 
     replies = relationship(
         'AnswerTable',
         primaryjoin='foreign(AnswerTable.parent_id) == AnswerTable.id',
         back_populates='parent',
         cascade='all, delete-orphan',
+        passive_deletes=True,
         order_by='AnswerTable.created_at',
     )
 
@@ -77,6 +104,24 @@ class AnswerTable(Base):
         back_populates='replies',
     )
 
+    __table_args__ = (
+        Index(
+            'ix_answer_question_id_parent_id_created_at',
+            'question_id',
+            'parent_id',
+            'created_at',
+            'id',
+        ),
+        Index('ix_answer_parent_id_created_at', 'parent_id', 'created_at', 'id'),
+        Index(
+            'ix_answer_deleted_created_at_id',
+            'created_at',
+            'id',
+            sqlite_where=text('deleted_at IS NOT NULL'),
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
+    )
+
 
 class QuestionTable(Base):
     __tablename__ = 'question'
@@ -86,9 +131,7 @@ class QuestionTable(Base):
     creator_ip = Column(String, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
 
-    created_at = Column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
-    )
+    created_at = Column(CreatedAt, nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -97,32 +140,24 @@ class QuestionTable(Base):
     )
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
+    __table_args__ = (
+        Index('ix_question_created_at_id', 'created_at', 'id'),
+        Index(
+            'ix_question_deleted_created_at_id',
+            'created_at',
+            'id',
+            sqlite_where=text('deleted_at IS NOT NULL'),
+            postgresql_where=text('deleted_at IS NOT NULL'),
+        ),
+    )
+
     answers = relationship(
         'AnswerTable',
         primaryjoin='and_(QuestionTable.id == AnswerTable.question_id, AnswerTable.parent_id == None)',
         back_populates='question',
         cascade='all, delete-orphan',
+        passive_deletes=True,
         order_by='AnswerTable.created_at',
     )
 
-    answer_count = column_property(
-        select(func.count(1))
-        .where(and_(AnswerTable.question_id == id, AnswerTable.deleted_at.is_(None)))
-        .correlate_except(text('QuestionTable'))
-        .scalar_subquery()
-    )
-
-
-replies_alias = aliased(AnswerTable, name='replies_alias')
-
-AnswerTable.reply_count = column_property(
-    select(func.count(replies_alias.id))
-    .where(
-        and_(
-            replies_alias.parent_id == AnswerTable.id,
-            replies_alias.deleted_at.is_(None),
-        )
-    )
-    .correlate_except(replies_alias)
-    .scalar_subquery()
-)
+    answer_count = Column(Integer, nullable=False, default=0, server_default='0')
@@ -1,12 +1,47 @@
+import re
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping
 from datetime import UTC, datetime
 
-from sqlalchemy import func, update
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Float,
+    Select,
+    String,
+    Subquery,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    text,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from src.application.dtos import QuestionViewResponse, TodoViewResponse
+from src.application.ports import (
+    AdminQueries,
+    DeletedItemView,
+    QuestionQueries,
+    TodoQueries,
+)
 from src.domain.entity import Answer, Question, Todo
 from src.domain.exceptions import NotFoundError, PersistenceError
-from src.domain.repos import AnswerRepository, QuestionRepository, TodoRepository
+from src.domain.repos import (
+    AnswerRepository,
+    Cursor,
+    QuestionRepository,
+    TodoRepository,
+)
 from src.infrastructure.adapters_out.datebase.mappers import (
     AnswerMapper,
     QuestionMapper,
@@ -14,11 +49,163 @@ from src.infrastructure.adapters_out.datebase.mappers import (
 )
 from src.infrastructure.adapters_out.datebase.models import (
     AnswerTable,
+    ItemCountTable,
     QuestionTable,
     TodoTable,
 )
 
 
+async def _adjust_count(
+    session: AsyncSession, entity: str, *, live: int = 0, deleted: int = 0
+) -> None:
+    if not live and not deleted:
+        return
+    stmt = (
+        update(ItemCountTable)
+        .where(ItemCountTable.entity == entity)
+        .values(
+            live_count=ItemCountTable.live_count + live,
+            deleted_count=ItemCountTable.deleted_count + deleted,
+        )
+    )
+    await session.execute(stmt)
+
+
+async def _adjust_thread_counts(
+    session: AsyncSession,
+    *,
+    question_id: str,
+    parent_id: str | None,
+    answers: int = 0,
+    replies: int = 0,
+) -> None:
+    if answers:
+        await session.execute(
+            update(QuestionTable)
+            .where(QuestionTable.id == question_id)
+            .values(
+                answer_count=QuestionTable.answer_count + answers,
+                updated_at=QuestionTable.updated_at,
+            )
+        )
+    if replies and parent_id is not None:
+        await session.execute(
+            update(AnswerTable)
+            .where(AnswerTable.id == parent_id)
+            .values(
+                reply_count=AnswerTable.reply_count + replies,
+                updated_at=AnswerTable.updated_at,
+            )
+        )
+
+
+async def _release_thread_counts(
+    session: AsyncSession,
+    *,
+    answers: Mapping[str, int],
+    replies: Mapping[str, int],
+) -> None:
+    question, answer = QuestionTable.__table__, AnswerTable.__table__
+    if answers := {key: count for key, count in answers.items() if count}:
+        await session.execute(
+            update(question)
+            .where(question.c.id == bindparam('b_id'))
+            .values(
+                answer_count=question.c.answer_count - bindparam('b_count'),
+                updated_at=question.c.updated_at,
+            ),
+            [{'b_id': key, 'b_count': count} for key, count in answers.items()],
+        )
+    if replies := {key: count for key, count in replies.items() if count}:
+        await session.execute(
+            update(answer)
+            .where(answer.c.id == bindparam('b_id'))
+            .values(
+                reply_count=answer.c.reply_count - bindparam('b_count'),
+                updated_at=answer.c.updated_at,
+            ),
+            [{'b_id': key, 'b_count': count} for key, count in replies.items()],
+        )
+
+
+def _removed_delta(deleted_ats: list[datetime | None]) -> dict[str, int]:
+    deleted = sum(deleted_at is not None for deleted_at in deleted_ats)
+    return {'live': deleted - len(deleted_ats), 'deleted': -deleted}
+
+
+async def _count_by_state(
+    session: AsyncSession, rows: Subquery | CTE
+) -> tuple[int, int]:
+    query = select(
+        func.count(case((rows.c.deleted_at.is_(None), 1))),
+        func.count(rows.c.deleted_at),
+    )
+    live, deleted = (await session.execute(query)).one()
+    return live, deleted
+
+
+async def _read_count(
+    session: AsyncSession, entity: str, *, deleted: bool, fallback: Select
+) -> int:
+    column = ItemCountTable.deleted_count if deleted else ItemCountTable.live_count
+    result = await session.execute(
+        select(column).where(ItemCountTable.entity == entity)
+    )
+    count = result.scalar_one_or_none()
+    if count is None:
+        count = (await session.execute(fallback)).scalar_one()
+    return count
+
+
+def _past_cursor(
+    table: type[TodoTable] | type[QuestionTable] | type[AnswerTable],
+    cursor: Cursor,
+    *,
+    ascending: bool,
+) -> ColumnElement[bool]:
+    created_at, item_id = cursor
+    if ascending:
+        return or_(
+            table.created_at > created_at,
+            and_(table.created_at == created_at, table.id > item_id),
+        )
+    return or_(
+        table.created_at < created_at,
+        and_(table.created_at == created_at, table.id < item_id),
+    )
+
+
+def _apply_keyset(
+    query: Select,
+    table: type[TodoTable] | type[QuestionTable] | type[AnswerTable],
+    *,
+    after: Cursor | None,
+    before: Cursor | None,
+    ascending: bool = False,
+) -> Select:
+    if before is not None:
+        ascending = not ascending
+        query = query.where(_past_cursor(table, before, ascending=ascending))
+    elif after is not None:
+        query = query.where(_past_cursor(table, after, ascending=ascending))
+
+    if ascending:
+        return query.order_by(table.created_at.asc(), table.id.asc())
+    return query.order_by(table.created_at.desc(), table.id.desc())
+
+
+def _assemble_thread(answers: list[Answer]) -> list[Answer]:
+    by_id = {answer.id: answer for answer in answers}
+    roots = []
+    for answer in answers:
+        parent = by_id.get(answer.parent_id) if answer.parent_id else None
+        if parent is None:
+            roots.append(answer)
+        else:
+            parent.replies.append(answer)
+    return roots
+
+
 class SqlAlchemyTodoRepository(TodoRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -28,48 +215,27 @@ class SqlAlchemyTodoRepository(TodoRepository):
             todo_table = TodoMapper.to_table(todo)
             self.session.add(todo_table)
             await self.session.flush()
+            await _adjust_count(self.session, TodoTable.__tablename__, live=1)
             return TodoMapper.to_domain(todo_table)
         except Exception as e:
             raise PersistenceError(original_exception=e)
 
-    async def get_list(self, skip: int = 0, limit: int = 10) -> tuple[list[Todo], int]:
-        count_query = select(func.count(TodoTable.id)).where(
-            TodoTable.deleted_at.is_(None)
-        )
-        total_items_result = await self.session.execute(count_query)
-        total_items = total_items_result.scalar_one()
-
-        query = (
-            select(TodoTable)
-            .where(TodoTable.deleted_at.is_(None))
-            .order_by(TodoTable.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(query)
-        all_todos_table = result.scalars().all()
-
-        return [TodoMapper.to_domain(t) for t in all_todos_table], total_items
-
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Todo], int]:
-        count_query = select(func.count(TodoTable.id)).where(
-            TodoTable.deleted_at.is_not(None)
-        )
-        total_items_result = await self.session.execute(count_query)
-        total_items = total_items_result.scalar_one()
-
-        query = (
-            select(TodoTable)
-            .where(TodoTable.deleted_at.is_not(None))
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(query)
-        all_todos_table = result.scalars().all()
-
-        return [TodoMapper.to_domain(t) for t in all_todos_table], total_items
+    async def add_many(self, todos: list[Todo]) -> list[Todo]:
+        if not todos:
+            return []
+        try:
+            await self.session.execute(
+                insert(TodoTable.__table__),
+                [TodoMapper.to_values(todo) for todo in todos],
+            )
+            await _adjust_count(self.session, TodoTable.__tablename__, live=len(todos))
+            created = {
+                todo.id: todo
+                for todo in await self.get_many([todo.id for todo in todos])
+            }
+            return [created[todo.id] for todo in todos]
+        except Exception as e:
+            raise PersistenceError(original_exception=e)
 
     async def get(self, todo_id: str) -> Todo | None:
         query = select(TodoTable).where(
@@ -82,6 +248,22 @@ class SqlAlchemyTodoRepository(TodoRepository):
             return TodoMapper.to_domain(todo_table)
         return None
 
+    async def get_many(self, todo_ids: list[str]) -> list[Todo]:
+        if not todo_ids:
+            return []
+        query = select(TodoTable).where(
+            TodoTable.id.in_(todo_ids), TodoTable.deleted_at.is_(None)
+        )
+        result = await self.session.execute(query)
+        return [TodoMapper.to_domain(t) for t in result.scalars().all()]
+
+    async def get_existing_ids(self, todo_ids: list[str]) -> set[str]:
+        if not todo_ids:
+            return set()
+        query = select(TodoTable.id).where(TodoTable.id.in_(todo_ids))
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def get_any(self, todo_id: str) -> Todo | None:
         todo_table = await self.session.get(TodoTable, todo_id)
         if todo_table:
@@ -102,6 +284,24 @@ class SqlAlchemyTodoRepository(TodoRepository):
                 raise
             raise PersistenceError(original_exception=e)
 
+    async def set_completed_many(
+        self, todo_ids: list[str], *, is_completed: bool
+    ) -> list[Todo]:
+        if not todo_ids:
+            return []
+        try:
+            stmt = (
+                update(TodoTable)
+                .where(TodoTable.id.in_(todo_ids), TodoTable.deleted_at.is_(None))
+                .values(is_completed=is_completed)
+                .returning(TodoTable)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.scalars(stmt)
+            return [TodoMapper.to_domain(t) for t in result.all()]
+        except Exception as e:
+            raise PersistenceError(original_exception=e)
+
     async def delete(self, todo_id: str) -> None:
         try:
             stmt = (
@@ -110,7 +310,11 @@ class SqlAlchemyTodoRepository(TodoRepository):
                 .values(deleted_at=datetime.now(UTC))
             )
             result = await self.session.execute(stmt)
-            if result.rowcount == 0:
+            if result.rowcount == 1:
+                await _adjust_count(
+                    self.session, TodoTable.__tablename__, live=-1, deleted=1
+                )
+            else:
                 exists = await self.session.get(TodoTable, todo_id)
                 if exists is None:
                     raise NotFoundError(f'Todo with id {todo_id} not found.')
@@ -120,12 +324,47 @@ class SqlAlchemyTodoRepository(TodoRepository):
                 raise
             raise PersistenceError(original_exception=e)
 
+    async def delete_many(self, todo_ids: list[str]) -> list[str]:
+        if not todo_ids:
+            return []
+        try:
+            stmt = (
+                update(TodoTable)
+                .where(TodoTable.id.in_(todo_ids), TodoTable.deleted_at.is_(None))
+                .values(deleted_at=datetime.now(UTC))
+                .returning(TodoTable.id)
+            )
+            deleted_ids = list((await self.session.execute(stmt)).scalars())
+            await _adjust_count(
+                self.session,
+                TodoTable.__tablename__,
+                live=-len(deleted_ids),
+                deleted=len(deleted_ids),
+            )
+            await self.session.flush()
+            return deleted_ids
+        except Exception as e:
+            raise PersistenceError(original_exception=e)
+
     async def hard_delete(self, todo_id: str) -> None:
+        await self.hard_delete_many([todo_id])
+
+    async def hard_delete_many(self, todo_ids: list[str]) -> list[str]:
+        if not todo_ids:
+            return []
         try:
-            todo_table = await self.session.get(TodoTable, todo_id)
-            if todo_table:
-                await self.session.delete(todo_table)
-                await self.session.flush()
+            stmt = (
+                delete(TodoTable)
+                .where(TodoTable.id.in_(todo_ids))
+                .returning(TodoTable.id, TodoTable.deleted_at)
+            )
+            rows = (await self.session.execute(stmt)).all()
+            await _adjust_count(
+                self.session,
+                TodoTable.__tablename__,
+                **_removed_delta([row.deleted_at for row in rows]),
+            )
+            return [row.id for row in rows]
         except Exception as e:
             raise PersistenceError(original_exception=e)
 
@@ -139,67 +378,55 @@ class SqlAlchemyQuestionRepository(QuestionRepository):
             question_table = QuestionMapper.to_table(question)
             self.session.add(question_table)
             await self.session.flush()
+            await _adjust_count(self.session, QuestionTable.__tablename__, live=1)
             await self.session.refresh(question_table)
             return QuestionMapper.to_domain(question_table)
         except Exception as e:
             raise PersistenceError(original_exception=e)
 
-    async def get_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Question], int]:
-        count_query = select(func.count(QuestionTable.id)).where(
-            QuestionTable.deleted_at.is_(None)
-        )
-        total_items_result = await self.session.execute(count_query)
-        total_items = total_items_result.scalar_one()
-
-        query = (
-            select(QuestionTable)
-            .where(QuestionTable.deleted_at.is_(None))
-            .order_by(QuestionTable.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+    async def get(self, question_id: str) -> Question | None:
+        query = select(QuestionTable).where(
+            QuestionTable.id == question_id, QuestionTable.deleted_at.is_(None)
         )
         result = await self.session.execute(query)
-        all_questions_table = result.scalars().all()
-
-        return [QuestionMapper.to_domain(q) for q in all_questions_table], total_items
+        question_table = result.scalars().first()
 
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Question], int]:
-        count_query = select(func.count(QuestionTable.id)).where(
-            QuestionTable.deleted_at.is_not(None)
-        )
-        total_items_result = await self.session.execute(count_query)
-        total_items = total_items_result.scalar_one()
+        if question_table:
+            return QuestionMapper.to_domain(question_table)
+        return None
 
-        query = (
-            select(QuestionTable)
-            .where(QuestionTable.deleted_at.is_not(None))
-            .order_by(QuestionTable.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+    async def get_thread(self, question_id: str) -> Question | None:
+        result = await self.session.execute(
+            select(QuestionTable).where(
+                QuestionTable.id == question_id, QuestionTable.deleted_at.is_(None)
+            )
         )
-        result = await self.session.execute(query)
-        all_questions_table = result.scalars().all()
-
-        return [QuestionMapper.to_domain(q) for q in all_questions_table], total_items
+        question_table = result.scalars().first()
+        if question_table is None:
+            return None
 
-    async def get(self, question_id: str) -> Question | None:
-        query = (
-            select(QuestionTable)
-            .where(QuestionTable.id == question_id, QuestionTable.deleted_at.is_(None))
-            .options(
-                selectinload(QuestionTable.answers).selectinload(AnswerTable.replies)
+        thread = (
+            select(AnswerTable.id)
+            .where(
+                AnswerTable.question_id == question_id,
+                AnswerTable.parent_id.is_(None),
             )
+            .cte('thread', recursive=True)
+        )
+        thread = thread.union_all(
+            select(AnswerTable.id).join(thread, AnswerTable.parent_id == thread.c.id)
+        )
+        result = await self.session.execute(
+            select(AnswerTable)
+            .join(thread, AnswerTable.id == thread.c.id)
+            .order_by(AnswerTable.created_at, AnswerTable.id)
         )
-        result = await self.session.execute(query)
-        question_table = result.scalars().first()
 
-        if question_table:
-            return QuestionMapper.to_domain(question_table)
-        return None
+        question = QuestionMapper.to_domain(question_table)
+        question.answers = _assemble_thread(
+            [AnswerMapper.to_domain(a) for a in result.scalars().all()]
+        )
+        return question
 
     async def get_any(self, question_id: str) -> Question | None:
         query = (
@@ -240,7 +467,11 @@ class SqlAlchemyQuestionRepository(QuestionRepository):
                 .values(deleted_at=datetime.now(UTC))
             )
             result = await self.session.execute(stmt)
-            if result.rowcount == 0:
+            if result.rowcount == 1:
+                await _adjust_count(
+                    self.session, QuestionTable.__tablename__, live=-1, deleted=1
+                )
+            else:
                 exists = await self.session.get(QuestionTable, question_id)
                 if exists is None:
                     raise NotFoundError(f'Question with id {question_id} not found.')
@@ -250,12 +481,63 @@ class SqlAlchemyQuestionRepository(QuestionRepository):
                 raise
             raise PersistenceError(original_exception=e)
 
+    async def delete_many(self, question_ids: list[str]) -> list[str]:
+        if not question_ids:
+            return []
+        try:
+            stmt = (
+                update(QuestionTable)
+                .where(
+                    QuestionTable.id.in_(question_ids),
+                    QuestionTable.deleted_at.is_(None),
+                )
+                .values(deleted_at=datetime.now(UTC))
+                .returning(QuestionTable.id)
+            )
+            deleted_ids = list((await self.session.execute(stmt)).scalars())
+            await _adjust_count(
+                self.session,
+                QuestionTable.__tablename__,
+                live=-len(deleted_ids),
+                deleted=len(deleted_ids),
+            )
+            await self.session.flush()
+            return deleted_ids
+        except Exception as e:
+            raise PersistenceError(original_exception=e)
+
     async def hard_delete(self, question_id: str) -> None:
+        await self.hard_delete_many([question_id])
+
+    async def hard_delete_many(self, question_ids: list[str]) -> list[str]:
+        if not question_ids:
+            return []
         try:
-            question_table = await self.session.get(QuestionTable, question_id)
-            if question_table:
-                await self.session.delete(question_table)
-                await self.session.flush()
+            live_answers, deleted_answers = await _count_by_state(
+                self.session,
+                select(AnswerTable.deleted_at)
+                .where(AnswerTable.question_id.in_(question_ids))
+                .subquery(),
+            )
+            # Answers go with their question through ON DELETE CASCADE.
+            stmt = (
+                delete(QuestionTable)
+                .where(QuestionTable.id.in_(question_ids))
+                .returning(QuestionTable.id, QuestionTable.deleted_at)
+            )
+            rows = (await self.session.execute(stmt)).all()
+            await _adjust_count(
+                self.session,
+                QuestionTable.__tablename__,
+                **_removed_delta([row.deleted_at for row in rows]),
+            )
+            await _adjust_count(
+                self.session,
+                AnswerTable.__tablename__,
+                live=-live_answers,
+                deleted=-deleted_answers,
+            )
+            return [row.id for row in rows]
         except Exception as e:
             raise PersistenceError(original_exception=e)
 
@@ -269,30 +551,84 @@ class SqlAlchemyAnswerRepository(AnswerRepository):
             answer_table = AnswerMapper.to_table(answer)
             self.session.add(answer_table)
             await self.session.flush()
+            await _adjust_count(self.session, AnswerTable.__tablename__, live=1)
+            await _adjust_thread_counts(
+                self.session,
+                question_id=answer_table.question_id,
+                parent_id=answer_table.parent_id,
+                answers=1,
+                replies=1,
+            )
             await self.session.refresh(answer_table)
             return AnswerMapper.to_domain(answer_table)
         except Exception as e:
             raise PersistenceError(original_exception=e)
 
-    async def get_deleted_list(
-        self, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Answer], int]:
-        count_query = select(func.count(AnswerTable.id)).where(
-            AnswerTable.deleted_at.is_not(None)
+    async def get_answers_by_cursor(
+        self,
+        question_id: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Answer], int | None]:
+        return await self._get_page_by_cursor(
+            and_(
+                AnswerTable.question_id == question_id,
+                AnswerTable.parent_id.is_(None),
+            ),
+            limit=limit,
+            after=after,
+            before=before,
+            include_total=include_total,
         )
-        total_items_result = await self.session.execute(count_query)
-        total_items = total_items_result.scalar_one()
 
-        query = (
-            select(AnswerTable)
-            .where(AnswerTable.deleted_at.is_not(None))
-            .offset(skip)
-            .limit(limit)
+    async def get_replies_by_cursor(
+        self,
+        parent_id: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Answer], int | None]:
+        return await self._get_page_by_cursor(
+            AnswerTable.parent_id == parent_id,
+            limit=limit,
+            after=after,
+            before=before,
+            include_total=include_total,
         )
+
+    async def _get_page_by_cursor(
+        self,
+        condition: ColumnElement[bool],
+        *,
+        limit: int,
+        after: Cursor | None,
+        before: Cursor | None,
+        include_total: bool,
+    ) -> tuple[list[Answer], int | None]:
+        total_items = None
+        if include_total:
+            total_items = await self.session.scalar(
+                select(func.count(AnswerTable.id)).where(condition)
+            )
+
+        query = _apply_keyset(
+            select(AnswerTable).where(condition),
+            AnswerTable,
+            after=after,
+            before=before,
+            ascending=True,
+        ).limit(limit)
         result = await self.session.execute(query)
-        all_answers_table = result.scalars().all()
+        all_answers_table = list(result.scalars().all())
+        if before is not None:
+            all_answers_table.reverse()
 
-        return [AnswerMapper.to_domain(t) for t in all_answers_table], total_items
+        return [AnswerMapper.to_domain(a) for a in all_answers_table], total_items
 
     async def get(self, answer_id: str) -> Answer | None:
         query = (
@@ -340,9 +676,22 @@ class SqlAlchemyAnswerRepository(AnswerRepository):
                 update(AnswerTable)
                 .where(AnswerTable.id == answer_id, AnswerTable.deleted_at.is_(None))
                 .values(deleted_at=datetime.now(UTC))
+                .returning(AnswerTable.question_id, AnswerTable.parent_id)
             )
             result = await self.session.execute(stmt)
-            if result.rowcount == 0:
+            deleted = result.first()
+            if deleted is not None:
+                await _adjust_count(
+                    self.session, AnswerTable.__tablename__, live=-1, deleted=1
+                )
+                await _adjust_thread_counts(
+                    self.session,
+                    question_id=deleted.question_id,
+                    parent_id=deleted.parent_id,
+                    answers=-1,
+                    replies=-1,
+                )
+            else:
                 exists = await self.session.get(AnswerTable, answer_id)
                 if exists is None:
                     raise NotFoundError(f'Answer with id {answer_id} not found.')
@@ -352,11 +701,440 @@ class SqlAlchemyAnswerRepository(AnswerRepository):
                 raise
             raise PersistenceError(original_exception=e)
 
+    async def delete_many(self, answer_ids: list[str]) -> dict[str, str]:
+        if not answer_ids:
+            return {}
+        try:
+            stmt = (
+                update(AnswerTable)
+                .where(AnswerTable.id.in_(answer_ids), AnswerTable.deleted_at.is_(None))
+                .values(deleted_at=datetime.now(UTC))
+                .returning(
+                    AnswerTable.id, AnswerTable.question_id, AnswerTable.parent_id
+                )
+            )
+            rows = (await self.session.execute(stmt)).all()
+            await _adjust_count(
+                self.session,
+                AnswerTable.__tablename__,
+                live=-len(rows),
+                deleted=len(rows),
+            )
+            await _release_thread_counts(
+                self.session,
+                answers=Counter(row.question_id for row in rows),
+                replies=Counter(row.parent_id for row in rows if row.parent_id),
+            )
+            await self.session.flush()
+            return {row.id: row.question_id for row in rows}
+        except Exception as e:
+            raise PersistenceError(original_exception=e)
+
     async def hard_delete(self, answer_id: str) -> None:
+        await self.hard_delete_many([answer_id])
+
+    async def hard_delete_many(self, answer_ids: list[str]) -> dict[str, str]:
+        if not answer_ids:
+            return {}
         try:
-            answer_table = await self.session.get(AnswerTable, answer_id)
-            if answer_table:
-                await self.session.delete(answer_table)
-                await self.session.flush()
+            result = await self.session.execute(
+                select(AnswerTable.id, AnswerTable.question_id).where(
+                    AnswerTable.id.in_(answer_ids)
+                )
+            )
+            roots = dict(result.tuples().all())
+            if not roots:
+                return {}
+
+            columns = (
+                AnswerTable.id,
+                AnswerTable.question_id,
+                AnswerTable.parent_id,
+                AnswerTable.deleted_at,
+            )
+            subtree = (
+                select(*columns)
+                .where(AnswerTable.id.in_(roots))
+                .cte('subtree', recursive=True)
+            )
+            subtree = subtree.union(
+                select(*columns).where(AnswerTable.parent_id == subtree.c.id)
+            )
+            # Only the parents left standing keep a reply count worth fixing.
+            outer_parent = case(
+                (subtree.c.parent_id.in_(select(subtree.c.id)), null()),
+                else_=subtree.c.parent_id,
+            ).label('outer_parent')
+            counts = (
+                await self.session.execute(
+                    select(
+                        subtree.c.question_id,
+                        outer_parent,
+                        func.count(case((subtree.c.deleted_at.is_(None), 1))).label(
+                            'live'
+                        ),
+                        func.count(subtree.c.deleted_at).label('deleted'),
+                    ).group_by(subtree.c.question_id, outer_parent)
+                )
+            ).all()
+
+            # Replies go with their parent through ON DELETE CASCADE.
+            await self.session.execute(
+                delete(AnswerTable).where(AnswerTable.id.in_(roots))
+            )
+            await _adjust_count(
+                self.session,
+                AnswerTable.__tablename__,
+                live=-sum(row.live for row in counts),
+                deleted=-sum(row.deleted for row in counts),
+            )
+            answers: Counter[str] = Counter()
+            replies: Counter[str] = Counter()
+            for row in counts:
+                answers[row.question_id] += row.live
+                if row.outer_parent is not None:
+                    replies[row.outer_parent] += row.live
+            await _release_thread_counts(self.session, answers=answers, replies=replies)
+            return roots
         except Exception as e:
             raise PersistenceError(original_exception=e)
+
+
+_SEARCH_MATCHES = {
+    'sqlite': (
+        'SELECT question.id AS question_id, bm25(question_fts, 4.0, 1.0) AS rank '
+        'FROM question_fts JOIN question ON question.rowid = question_fts.rowid '
+        'WHERE question_fts MATCH :terms '
+        'UNION ALL '
+        'SELECT answer.question_id, 0.5 * bm25(answer_fts) '
+        'FROM answer_fts JOIN answer ON answer.rowid = answer_fts.rowid '
+        'WHERE answer_fts MATCH :terms AND answer.deleted_at IS NULL'
+    ),
+    'postgresql': (
+        'SELECT id AS question_id, '
+        "-ts_rank(search_vector, to_tsquery('simple', :terms)) AS rank "
+        "FROM question WHERE search_vector @@ to_tsquery('simple', :terms) "
+        'UNION ALL '
+        "SELECT question_id, -ts_rank(search_vector, to_tsquery('simple', :terms)) "
+        "FROM answer WHERE search_vector @@ to_tsquery('simple', :terms) "
+        'AND deleted_at IS NULL'
+    ),
+}
+
+
+def _search_terms(query: str, dialect: str) -> str | None:
+    words = re.findall(r'[^\W_]+', query)
+    if not words:
+        return None
+    if dialect == 'postgresql':
+        return ' & '.join(f'{word}:*' for word in words)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def _search_hits(dialect: str, terms: str) -> Subquery:
+    if dialect not in _SEARCH_MATCHES:
+        raise PersistenceError(
+            NotImplementedError(f'Full-text search is not supported on {dialect}.')
+        )
+    matches = (
+        text(_SEARCH_MATCHES[dialect])
+        .bindparams(terms=terms)
+        .columns(question_id=String, rank=Float)
+        .subquery('matches')
+    )
+    return (
+        select(matches.c.question_id, func.min(matches.c.rank).label('rank'))
+        .group_by(matches.c.question_id)
+        .subquery('hits')
+    )
+
+
+class SqlAlchemyTodoQueries(TodoQueries):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_list(
+        self, skip: int = 0, limit: int = 10, include_total: bool = True
+    ) -> tuple[list[TodoViewResponse], int | None]:
+        total_items = await self._count() if include_total else None
+        query = (
+            self._view_query()
+            .order_by(TodoTable.created_at.desc(), TodoTable.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+
+        return [TodoMapper.to_view(row) for row in result], total_items
+
+    async def get_list_by_cursor(
+        self,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[TodoViewResponse], int | None]:
+        total_items = await self._count() if include_total else None
+        query = _apply_keyset(
+            self._view_query(), TodoTable, after=after, before=before
+        ).limit(limit)
+        rows = list(await self.session.execute(query))
+        if before is not None:
+            rows.reverse()
+
+        return [TodoMapper.to_view(row) for row in rows], total_items
+
+    async def stream_list(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[TodoViewResponse]]:
+        query = (
+            self._view_query()
+            .order_by(TodoTable.created_at, TodoTable.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield [TodoMapper.to_view(row) for row in rows]
+
+    @staticmethod
+    def _view_query() -> Select:
+        return select(*TodoMapper.VIEW_COLUMNS).where(TodoTable.deleted_at.is_(None))
+
+    async def _count(self) -> int:
+        return await _read_count(
+            self.session,
+            TodoTable.__tablename__,
+            deleted=False,
+            fallback=select(func.count(TodoTable.id)).where(
+                TodoTable.deleted_at.is_(None)
+            ),
+        )
+
+
+class SqlAlchemyQuestionQueries(QuestionQueries):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_list(
+        self, skip: int = 0, limit: int = 10, include_total: bool = True
+    ) -> tuple[list[QuestionViewResponse], int | None]:
+        total_items = await self._count() if include_total else None
+        query = (
+            self._view_query()
+            .order_by(QuestionTable.created_at.desc(), QuestionTable.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+
+        return [QuestionMapper.to_view(row) for row in result], total_items
+
+    async def get_list_by_cursor(
+        self,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[QuestionViewResponse], int | None]:
+        total_items = await self._count() if include_total else None
+        query = _apply_keyset(
+            self._view_query(), QuestionTable, after=after, before=before
+        ).limit(limit)
+        rows = list(await self.session.execute(query))
+        if before is not None:
+            rows.reverse()
+
+        return [QuestionMapper.to_view(row) for row in rows], total_items
+
+    async def stream_list(
+        self, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[QuestionViewResponse]]:
+        query = (
+            self._view_query()
+            .order_by(QuestionTable.created_at, QuestionTable.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield [QuestionMapper.to_view(row) for row in rows]
+
+    async def search(
+        self,
+        query: str,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        include_total: bool = True,
+    ) -> tuple[list[QuestionViewResponse], int | None]:
+        dialect = self.session.get_bind().dialect.name
+        terms = _search_terms(query, dialect)
+        if terms is None:
+            return [], 0 if include_total else None
+
+        hits = _search_hits(dialect, terms)
+        total_items = None
+        if include_total:
+            total_items = await self.session.scalar(
+                select(func.count())
+                .select_from(hits)
+                .join(QuestionTable, QuestionTable.id == hits.c.question_id)
+                .where(QuestionTable.deleted_at.is_(None))
+            )
+        result = await self.session.execute(
+            self._view_query()
+            .join(hits, hits.c.question_id == QuestionTable.id)
+            .order_by(
+                hits.c.rank, QuestionTable.created_at.desc(), QuestionTable.id.desc()
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+
+        return [QuestionMapper.to_view(row) for row in result], total_items
+
+    @staticmethod
+    def _view_query() -> Select:
+        return select(*QuestionMapper.VIEW_COLUMNS).where(
+            QuestionTable.deleted_at.is_(None)
+        )
+
+    async def _count(self) -> int:
+        return await _read_count(
+            self.session,
+            QuestionTable.__tablename__,
+            deleted=False,
+            fallback=select(func.count(QuestionTable.id)).where(
+                QuestionTable.deleted_at.is_(None)
+            ),
+        )
+
+
+_DELETED_VIEWS = {
+    'todos': (TodoTable, TodoMapper),
+    'questions': (QuestionTable, QuestionMapper),
+    'answers': (AnswerTable, AnswerMapper),
+}
+_OVERVIEW_COLUMNS = {
+    column.name: column.type
+    for _, mapper in _DELETED_VIEWS.values()
+    for column in mapper.VIEW_COLUMNS
+}
+
+
+def _deleted_query(
+    table: type[TodoTable] | type[QuestionTable] | type[AnswerTable],
+    mapper: type[TodoMapper] | type[QuestionMapper] | type[AnswerMapper],
+) -> Select:
+    return select(*mapper.VIEW_COLUMNS).where(table.deleted_at.is_not(None))
+
+
+def _padded_deleted_page(
+    table: type[TodoTable] | type[QuestionTable] | type[AnswerTable],
+    mapper: type[TodoMapper] | type[QuestionMapper] | type[AnswerMapper],
+    *,
+    skip: int,
+    limit: int,
+) -> Select:
+    page = (
+        _apply_keyset(_deleted_query(table, mapper), table, after=None, before=None)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    return select(
+        literal(table.__tablename__).label('entity'),
+        *(
+            page.c[name] if name in page.c else cast(null(), type_).label(name)
+            for name, type_ in _OVERVIEW_COLUMNS.items()
+        ),
+    )
+
+
+class SqlAlchemyAdminQueries(AdminQueries):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_deleted_overview(
+        self, *, skip: int = 0, limit: int = 10
+    ) -> dict[str, tuple[list[DeletedItemView], int]]:
+        item_types = {
+            table.__tablename__: item_type
+            for item_type, (table, _) in _DELETED_VIEWS.items()
+        }
+        pages = union_all(
+            *(
+                _padded_deleted_page(table, mapper, skip=skip, limit=limit)
+                for table, mapper in _DELETED_VIEWS.values()
+            )
+        ).subquery('pages')
+        query = (
+            select(
+                ItemCountTable.entity,
+                ItemCountTable.deleted_count,
+                *(column for column in pages.c if column.key != 'entity'),
+            )
+            .outerjoin(pages, pages.c.entity == ItemCountTable.entity)
+            .where(ItemCountTable.entity.in_(item_types))
+            .order_by(
+                ItemCountTable.entity, pages.c.created_at.desc(), pages.c.id.desc()
+            )
+        )
+        result = await self.session.execute(query)
+
+        overview: dict[str, tuple[list[DeletedItemView], int]] = {}
+        for row in result:
+            item_type = item_types[row.entity]
+            items, _ = overview.setdefault(item_type, ([], row.deleted_count))
+            if row.id is not None:
+                items.append(_DELETED_VIEWS[item_type][1].to_view(row))
+
+        for item_type in _DELETED_VIEWS.keys() - overview.keys():
+            items, total = await self._get_deleted_page(
+                item_type, skip=skip, limit=limit
+            )
+            overview[item_type] = items, total
+        return overview
+
+    async def get_deleted_by_cursor(
+        self,
+        item_type: str,
+        *,
+        limit: int = 10,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[DeletedItemView], int | None]:
+        table, mapper = _DELETED_VIEWS[item_type]
+        total_items = await self._count(table) if include_total else None
+        query = _apply_keyset(
+            _deleted_query(table, mapper), table, after=after, before=before
+        ).limit(limit)
+        rows = list(await self.session.execute(query))
+        if before is not None:
+            rows.reverse()
+
+        return [mapper.to_view(row) for row in rows], total_items
+
+    async def _get_deleted_page(
+        self, item_type: str, *, skip: int, limit: int
+    ) -> tuple[list[DeletedItemView], int]:
+        table, mapper = _DELETED_VIEWS[item_type]
+        query = (
+            _apply_keyset(_deleted_query(table, mapper), table, after=None, before=None)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return [mapper.to_view(row) for row in result], await self._count(table)
+
+    async def _count(
+        self, table: type[TodoTable] | type[QuestionTable] | type[AnswerTable]
+    ) -> int:
+        return await _read_count(
+            self.session,
+            table.__tablename__,
+            deleted=True,
+            fallback=select(func.count(table.id)).where(table.deleted_at.is_not(None)),
+        )
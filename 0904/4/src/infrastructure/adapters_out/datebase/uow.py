@@ -1,36 +1,95 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState
 from src.domain.repos import UnitOfWork
 from src.infrastructure.adapters_out.datebase.repos import (
+    SqlAlchemyAdminQueries,
     SqlAlchemyAnswerRepository,
+    SqlAlchemyQuestionQueries,
     SqlAlchemyQuestionRepository,
+    SqlAlchemyTodoQueries,
     SqlAlchemyTodoRepository,
 )
 
+log = logging.getLogger(__name__)
+
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
+    commit_count = 0
+    skipped_commit_count = 0
+
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
         self.session_factory = session_factory
         self.session: AsyncSession | None = None
+        self.has_writes = False
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> 'SqlAlchemyUnitOfWork':
         self.session = self.session_factory()
+        self.has_writes = False
+        event.listen(self.session.sync_session, 'after_flush', self._on_flush)
+        event.listen(self.session.sync_session, 'do_orm_execute', self._on_execute)
         self.todo_repo = SqlAlchemyTodoRepository(self.session)
         self.question_repo = SqlAlchemyQuestionRepository(self.session)
         self.answer_repo = SqlAlchemyAnswerRepository(self.session)
+        self.todo_queries = SqlAlchemyTodoQueries(self.session)
+        self.question_queries = SqlAlchemyQuestionQueries(self.session)
+        self.admin_queries = SqlAlchemyAdminQueries(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         if self.session:
             if exc_type:
                 await self.rollback()
-            else:
+            elif self.has_writes or self.session.new or self.session.dirty:
                 await self.commit()
+            else:
+                await self.rollback()
+                SqlAlchemyUnitOfWork.skipped_commit_count += 1
             await self.session.close()
 
     async def commit(self) -> None:
         if self.session:
             await self.session.commit()
+            self.has_writes = False
+            SqlAlchemyUnitOfWork.commit_count += 1
+            for callback in self._after_commit:
+                try:
+                    await callback()
+                except Exception:
+                    # The data is committed; a failed hook must not fail the request.
+                    log.exception('After-commit callback failed.')
 
     async def rollback(self) -> None:
         if self.session:
             await self.session.rollback()
+            self.has_writes = False
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._after_commit.append(callback)
+
+    def _on_flush(self, session, flush_context) -> None:
+        self.has_writes = True
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            self.has_writes = True
+
+
+class SqlAlchemyReadOnlyUnitOfWork(SqlAlchemyUnitOfWork):
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.session:
+            await self.rollback()
+            if not exc_type:
+                SqlAlchemyUnitOfWork.skipped_commit_count += 1
+            await self.session.close()
+
+    async def commit(self) -> None:
+        raise RuntimeError('Read-only unit of work cannot commit.')
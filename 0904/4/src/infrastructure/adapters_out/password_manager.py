@@ -1,11 +1,24 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
-from src.application.ports import PasswordManager
+from src.application.ports import AsyncPasswordManager, PasswordManager
 
 
 class BcryptPasswordManager(PasswordManager):
+    def __init__(self, *, rounds: int = 12):
+        self.rounds = rounds
+
     def hash(self, password: str) -> str:
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        return bcrypt.hashpw(
+            password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)
+        ).decode('utf-8')
 
     def verify(self, password: str, password_hash: str) -> bool:
         try:
@@ -14,3 +27,83 @@ class BcryptPasswordManager(PasswordManager):
             )
         except (ValueError, TypeError):
             return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        try:
+            return int(password_hash.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+
+class ThreadPoolPasswordManager(AsyncPasswordManager):
+    def __init__(self, password_manager: PasswordManager, *, max_workers: int):
+        self.password_manager = password_manager
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='password-manager'
+        )
+
+    async def hash(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.password_manager.hash, password
+        )
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.password_manager.verify, password, password_hash
+        )
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self.password_manager.needs_rehash(password_hash)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+class CachingPasswordManager(AsyncPasswordManager):
+    def __init__(
+        self,
+        password_manager: AsyncPasswordManager,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+    ):
+        self.password_manager = password_manager
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._key_secret = secrets.token_bytes(32)
+        self._verified: OrderedDict[tuple[str, bytes], float] = OrderedDict()
+
+    async def hash(self, password: str) -> str:
+        return await self.password_manager.hash(password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        key = (password_hash, self._digest(password))
+        expires_at = self._verified.get(key)
+        if expires_at is not None and expires_at > time.monotonic():
+            self._verified.move_to_end(key)
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        self._verified.pop(key, None)
+        verified = await self.password_manager.verify(password, password_hash)
+        if verified and self.max_size > 0:
+            self._verified[key] = time.monotonic() + self.ttl_seconds
+            while len(self._verified) > self.max_size:
+                self._verified.popitem(last=False)
+        return verified
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self.password_manager.needs_rehash(password_hash)
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._verified)}
+
+    def _digest(self, password: str) -> bytes:
+        return hmac.new(
+            self._key_secret, password.encode('utf-8'), hashlib.sha256
+        ).digest()
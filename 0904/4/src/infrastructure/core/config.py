@@ -1,11 +1,49 @@
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     CSV_FILE: str = 'todo_data.csv'
     FIELDNAMES: list[str] = ['id', 'task', 'due_date', 'is_completed']
+    QUESTION_CSV_FILE: str = 'question_data.csv'
+    QUESTION_FIELDNAMES: list[str] = [
+        'id',
+        'subject',
+        'content',
+        'answer_count',
+        'created_at',
+    ]
+    EXPORT_BATCH_SIZE: int = 1000
+    IMPORT_BATCH_SIZE: int = 500
     DATABASE_URL: str = 'sqlite+aiosqlite:///./sql_app.db'
+    DATABASE_REPLICA_URL: str | None = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: Literal['OFF', 'NORMAL', 'FULL', 'EXTRA'] = 'NORMAL'
+    SQLITE_CACHE_SIZE: int = -20000
+    SQLITE_MMAP_SIZE: int = 134217728
+    SQLITE_BUSY_TIMEOUT: int = 5000
     TRUSTED_IPS: tuple[str, ...] = ('127.0.0.1', 'localhost')
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_CACHE_MAX_SIZE: int = 1024
+    PASSWORD_CACHE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_MAX_SIZE: int = 2048
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_REDIS_URL: str | None = None
+    PURGE_ENABLED: bool = False
+    PURGE_RETENTION_DAYS: float = 30.0
+    PURGE_BATCH_SIZE: int = 500
+    PURGE_BATCH_PAUSE_SECONDS: float = 0.5
+    PURGE_INTERVAL_SECONDS: float = 3600.0
+    METRICS_ENABLED: bool = True
 
     class Config:
         env_file = '../../.env'
@@ -1,12 +1,74 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 
 from src.infrastructure.core.config import settings
+from src.infrastructure.core.metrics import InstrumentedQueuePool, instrument_engine
+
+
+def engine_options(database_url: str) -> dict[str, Any]:
+    url = make_url(database_url)
+    options: dict[str, Any] = {
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+    }
+    if url.get_backend_name() != 'sqlite':
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    # In-memory SQLite keeps its single static connection.
+    if settings.METRICS_ENABLED and url.database not in (None, '', ':memory:'):
+        options['poolclass'] = InstrumentedQueuePool
+    if url.get_driver_name() == 'asyncpg':
+        options['connect_args'] = {
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    if settings.SQLITE_WAL:
+        cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute(f'PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}')
+    cursor.execute(f'PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}')
+    cursor.execute(f'PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}')
+    cursor.execute(f'PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}')
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
 
-engine = create_async_engine(settings.DATABASE_URL)
+
+def create_engine(database_url: str) -> AsyncEngine:
+    new_engine = create_async_engine(database_url, **engine_options(database_url))
+    if new_engine.dialect.name == 'sqlite':
+        event.listen(new_engine.sync_engine, 'connect', set_sqlite_pragmas)
+    if settings.METRICS_ENABLED:
+        instrument_engine(new_engine.sync_engine)
+    return new_engine
+
+
+engine = create_engine(settings.DATABASE_URL)
+replica_engine = (
+    create_engine(settings.DATABASE_REPLICA_URL)
+    if settings.DATABASE_REPLICA_URL
+    else engine
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
+ReadOnlySessionLocal = async_sessionmaker(
+    bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 Base = declarative_base()
@@ -2,11 +2,18 @@ from collections.abc import AsyncGenerator
 
 from fastapi import Depends, Request
 
-from src.application.ports import PasswordManager
+from src.application.ports import (
+    AsyncPasswordManager,
+    Cache,
+    QuestionQueries,
+    TodoQueries,
+)
 from src.application.services import (
+    CACHED_MODELS,
     AdminService,
     AnswerService,
     QuestionService,
+    TodoImportService,
     TodoService,
 )
 from src.domain.exceptions import AuthorizationError
@@ -16,10 +23,44 @@ from src.domain.repos import (
     TodoRepository,
     UnitOfWork,
 )
-from src.infrastructure.adapters_out.datebase.uow import SqlAlchemyUnitOfWork
-from src.infrastructure.adapters_out.password_manager import BcryptPasswordManager
+from src.infrastructure.adapters_out.cache import (
+    CommitBoundCache,
+    InMemoryCache,
+    RedisCache,
+)
+from src.infrastructure.adapters_out.datebase.uow import (
+    SqlAlchemyReadOnlyUnitOfWork,
+    SqlAlchemyUnitOfWork,
+)
+from src.infrastructure.adapters_out.password_manager import (
+    BcryptPasswordManager,
+    CachingPasswordManager,
+    ThreadPoolPasswordManager,
+)
 from src.infrastructure.core.config import settings
-from src.infrastructure.core.database import AsyncSessionLocal
+from src.infrastructure.core.database import AsyncSessionLocal, ReadOnlySessionLocal
+
+hashing_pool = ThreadPoolPasswordManager(
+    BcryptPasswordManager(rounds=settings.BCRYPT_ROUNDS),
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+)
+password_manager = CachingPasswordManager(
+    hashing_pool,
+    max_size=settings.PASSWORD_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PASSWORD_CACHE_TTL_SECONDS,
+)
+response_cache: InMemoryCache | RedisCache = (
+    RedisCache.from_url(
+        settings.RESPONSE_CACHE_REDIS_URL,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        models=CACHED_MODELS,
+    )
+    if settings.RESPONSE_CACHE_REDIS_URL
+    else InMemoryCache(
+        max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+)
 
 
 async def get_uow() -> AsyncGenerator[UnitOfWork, None]:
@@ -32,6 +73,13 @@ async def get_uow() -> AsyncGenerator[UnitOfWork, None]:
             raise
 
 
+async def get_read_uow() -> AsyncGenerator[UnitOfWork, None]:
+    uow = SqlAlchemyReadOnlyUnitOfWork(ReadOnlySessionLocal)
+
+    async with uow:
+        yield uow
+
+
 async def get_todo_repo(uow: UnitOfWork = Depends(get_uow)) -> TodoRepository:
     return uow.todo_repo
 
@@ -44,39 +92,130 @@ async def get_answer_repo(uow: UnitOfWork = Depends(get_uow)) -> AnswerRepositor
     return uow.answer_repo
 
 
-def get_password_manager() -> PasswordManager:
-    return BcryptPasswordManager()
+async def get_todo_queries(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+) -> TodoQueries:
+    return uow.todo_queries
+
+
+async def get_question_queries(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+) -> QuestionQueries:
+    return uow.question_queries
+
+
+def get_password_manager() -> AsyncPasswordManager:
+    return password_manager
+
+
+def get_response_cache() -> Cache:
+    return response_cache
+
+
+def get_write_cache(
+    uow: UnitOfWork = Depends(get_uow), cache: Cache = Depends(get_response_cache)
+) -> Cache:
+    return CommitBoundCache(cache, uow)
+
+
+def get_admin_service(
+    uow: UnitOfWork = Depends(get_uow), cache: Cache = Depends(get_write_cache)
+) -> AdminService:
+    return AdminService(uow=uow, cache=cache)
 
 
-def get_admin_service(uow: UnitOfWork = Depends(get_uow)) -> AdminService:
-    return AdminService(uow=uow)
+def get_admin_read_service(
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_uow),
+) -> AdminService:
+    return AdminService(uow=uow, admin_queries=uow.admin_queries)
 
 
 def get_todo_service(
     todo_repo: TodoRepository = Depends(get_todo_repo),
-    password_manager: PasswordManager = Depends(get_password_manager),
+    todo_queries: TodoQueries = Depends(get_todo_queries),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_write_cache),
 ) -> TodoService:
-    return TodoService(todo_repo=todo_repo, password_manager=password_manager)
+    return TodoService(
+        todo_repo=todo_repo,
+        todo_queries=todo_queries,
+        password_manager=password_manager,
+        cache=cache,
+    )
+
+
+def get_todo_import_service(
+    uow: UnitOfWork = Depends(get_uow),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_response_cache),
+) -> TodoImportService:
+    return TodoImportService(uow=uow, password_manager=password_manager, cache=cache)
 
 
 def get_question_service(
     question_repo: QuestionRepository = Depends(get_question_repo),
-    password_manager: PasswordManager = Depends(get_password_manager),
+    question_queries: QuestionQueries = Depends(get_question_queries),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_write_cache),
 ) -> QuestionService:
     return QuestionService(
-        question_repo=question_repo, password_manager=password_manager
+        question_repo=question_repo,
+        question_queries=question_queries,
+        password_manager=password_manager,
+        cache=cache,
     )
 
 
 def get_answer_service(
     answer_repo: AnswerRepository = Depends(get_answer_repo),
     question_repo: QuestionRepository = Depends(get_question_repo),
-    password_manager: PasswordManager = Depends(get_password_manager),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_write_cache),
 ) -> AnswerService:
     return AnswerService(
         answer_repo=answer_repo,
         question_repo=question_repo,
         password_manager=password_manager,
+        cache=cache,
+    )
+
+
+def get_todo_read_service(
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_uow),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_response_cache),
+) -> TodoService:
+    return TodoService(
+        todo_repo=uow.todo_repo,
+        todo_queries=uow.todo_queries,
+        password_manager=password_manager,
+        cache=cache,
+    )
+
+
+def get_question_read_service(
+    uow: SqlAlchemyUnitOfWork = Depends(get_read_uow),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_response_cache),
+) -> QuestionService:
+    return QuestionService(
+        question_repo=uow.question_repo,
+        question_queries=uow.question_queries,
+        password_manager=password_manager,
+        cache=cache,
+    )
+
+
+def get_answer_read_service(
+    uow: UnitOfWork = Depends(get_read_uow),
+    password_manager: AsyncPasswordManager = Depends(get_password_manager),
+    cache: Cache = Depends(get_response_cache),
+) -> AnswerService:
+    return AnswerService(
+        answer_repo=uow.answer_repo,
+        question_repo=uow.question_repo,
+        password_manager=password_manager,
+        cache=cache,
     )
 
 
@@ -0,0 +1,261 @@
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SQL_OPERATIONS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH'})
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_sample(
+    name: str, labels: dict[str, str], value: float, suffix: str = ''
+) -> str:
+    label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+    if label_text:
+        label_text = f'{{{label_text}}}'
+    return f'{name}{suffix}{label_text} {value}'
+
+
+def format_family(
+    name: str, kind: str, documentation: str, samples: list[str]
+) -> Iterator[str]:
+    yield f'# HELP {name} {documentation}'
+    yield f'# TYPE {name} {kind}'
+    yield from samples
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> Iterator[str]:
+        samples = [
+            _format_sample(
+                self.name, dict(zip(self.labelnames, labelvalues, strict=True)), value
+            )
+            for labelvalues, value in sorted(self._values.items())
+        ]
+        return format_family(self.name, 'counter', self.documentation, samples)
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        *,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._bounds = [*map(str, buckets), '+Inf']
+        # Per label set: one count per bucket plus +Inf, then sum.
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def collect(self) -> Iterator[str]:
+        samples = []
+        for labelvalues, series in sorted(self._series.items()):
+            labels = dict(zip(self.labelnames, labelvalues, strict=True))
+            cumulative = 0
+            for bound, count in zip(self._bounds, series[:-1], strict=True):
+                cumulative += count
+                samples.append(
+                    _format_sample(
+                        self.name, {**labels, 'le': bound}, cumulative, '_bucket'
+                    )
+                )
+            samples.append(_format_sample(self.name, labels, series[-1], '_sum'))
+            samples.append(_format_sample(self.name, labels, cumulative, '_count'))
+        return format_family(self.name, 'histogram', self.documentation, samples)
+
+
+REQUEST_LABELS = ('method', 'route')
+
+http_requests = Counter(
+    'http_requests_total',
+    'HTTP requests handled, by route and status code.',
+    ('method', 'route', 'status'),
+)
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    'Time to handle an HTTP request, including streamed bodies.',
+    REQUEST_LABELS,
+)
+http_request_db_duration = Histogram(
+    'http_request_db_duration_seconds',
+    'Time spent executing SQL statements per HTTP request.',
+    REQUEST_LABELS,
+)
+http_request_db_statements = Histogram(
+    'http_request_db_statements',
+    'SQL statements executed per HTTP request.',
+    REQUEST_LABELS,
+    buckets=STATEMENT_BUCKETS,
+)
+http_request_pool_wait = Histogram(
+    'http_request_db_pool_wait_seconds',
+    'Time spent waiting for pooled database connections per HTTP request.',
+    REQUEST_LABELS,
+    buckets=POOL_WAIT_BUCKETS,
+)
+db_statement_duration = Histogram(
+    'db_statement_duration_seconds',
+    'Time to execute a single SQL statement, by operation.',
+    ('operation',),
+)
+db_pool_wait = Histogram(
+    'db_pool_wait_seconds',
+    'Time to check a connection out of the pool.',
+    (),
+    buckets=POOL_WAIT_BUCKETS,
+)
+
+COLLECTORS: tuple[Counter | Histogram, ...] = (
+    http_requests,
+    http_request_duration,
+    http_request_db_duration,
+    http_request_db_statements,
+    http_request_pool_wait,
+    db_statement_duration,
+    db_pool_wait,
+)
+
+
+def render_metrics() -> str:
+    lines = [line for collector in COLLECTORS for line in collector.collect()]
+    return '\n'.join(lines) + '\n'
+
+
+@dataclass
+class RequestStats:
+    statements: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    'request_stats', default=None
+)
+
+
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement else ''
+    return keyword if keyword in SQL_OPERATIONS else 'OTHER'
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    elapsed = time.perf_counter() - conn.info['query_start_time'].pop()
+    db_statement_duration.observe(elapsed, _operation(statement))
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('query_start_time'):
+        connection.info['query_start_time'].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(engine, 'handle_error', _handle_error)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    # The pool has no "before checkout" event, so time the checkout itself.
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            elapsed = time.perf_counter() - started
+            db_pool_wait.observe(elapsed)
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += elapsed
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get('route')
+    # Label by path template so ids in URLs don't explode the series count.
+    if not isinstance(route, APIRoute):
+        return 'other'
+    # Depending on the FastAPI version, routes of an included router may only
+    # know their path below the router prefix; take the prefix from the URL.
+    segments = scope['path'].split('/')
+    prefix = '/'.join(segments[: len(segments) - route.path.count('/')])
+    return prefix + route.path
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            labels = (scope['method'], _route_label(scope))
+            http_requests.inc(*labels, str(status_code))
+            http_request_duration.observe(elapsed, *labels)
+            http_request_db_duration.observe(stats.db_seconds, *labels)
+            http_request_db_statements.observe(stats.statements, *labels)
+            http_request_pool_wait.observe(stats.pool_wait_seconds, *labels)
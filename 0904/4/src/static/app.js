@@ -425,7 +425,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     async function renderQuestionDetailPage(id) {
         try {
-            const q = await fetchAPI(`/question/${id}`);
+            const q = await fetchAPI(`/question/${id}?include_answers=false`);
 
             root.innerHTML = `
                 <div class="container" id="question-container-${q.id}">
@@ -473,6 +473,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     <div class="answer-section">
                         <h2>답변 ${q.answer_count}개</h2>
                         <div id="answer-list"></div>
+                        <div class="load-more-container" id="load-more-answers"></div>
                     </div>
 
                     <form id="add-answer-form" class="answer-form" data-question-id="${q.id}">
@@ -507,19 +508,56 @@ document.addEventListener('DOMContentLoaded', () => {
             // 답변 폼 리스너
             document.getElementById('add-answer-form').addEventListener('submit', handleAddAnswer);
 
-            // 답변 목록 렌더링
-            const answerListElement = document.getElementById('answer-list');
-            if (q.answers && q.answers.length > 0) {
-                q.answers.forEach(answer => answerListElement.appendChild(createAnswerElement(answer)));
-            } else {
-                answerListElement.innerHTML = '<p>등록된 답변이 없습니다.</p>';
-            }
+            // 답변 목록 렌더링 (커서 기반으로 페이지 단위 로딩)
+            await loadAnswers(q.id);
 
         } catch (error) {
             renderError(error.message);
         }
     }
 
+    /**
+     * 최상위 답변을 한 페이지씩 불러와 목록 뒤에 붙입니다.
+     */
+    async function loadAnswers(questionId, cursor = null) {
+        const answerListElement = document.getElementById('answer-list');
+        const loadMoreContainer = document.getElementById('load-more-answers');
+        const params = new URLSearchParams({ limit: PAGE_SIZE, include_total: false });
+        if (cursor) params.set('after', cursor);
+
+        const data = await fetchAPI(`/question/${questionId}/answers?${params}`);
+        if (!cursor && data.items.length === 0) {
+            answerListElement.innerHTML = '<p>등록된 답변이 없습니다.</p>';
+        }
+        data.items.forEach(answer => answerListElement.appendChild(createAnswerElement(answer)));
+
+        loadMoreContainer.innerHTML = '';
+        if (data.next_cursor) {
+            renderLoadMoreButton(loadMoreContainer, '답변 더보기', () => loadAnswers(questionId, data.next_cursor));
+        }
+    }
+
+    /**
+     * '더보기' 버튼을 만들고, 로딩 중에는 비활성화합니다.
+     */
+    function renderLoadMoreButton(container, label, onLoad) {
+        const button = document.createElement('button');
+        button.className = 'btn btn-secondary btn-small load-more-replies';
+        button.textContent = label;
+        button.onclick = async () => {
+            button.textContent = '로딩 중...';
+            button.disabled = true;
+            try {
+                await onLoad();
+            } catch (error) {
+                alert(`로딩 실패: ${error.message}`);
+                button.textContent = '로딩 실패. 재시도';
+                button.disabled = false;
+            }
+        };
+        container.appendChild(button);
+    }
+
     /**
      * (재귀) 답변 및 대댓글 DOM 엘리먼트 생성
      */
@@ -601,19 +639,17 @@ document.addEventListener('DOMContentLoaded', () => {
         const repliesContainer = answerElement.querySelector(`#replies-for-${answer.id}`);
         const loadMoreContainer = answerElement.querySelector(`#load-more-for-${answer.id}`);
 
-        // 1. 사전 로드된 2단계 답글 렌더링
-        if (answer.replies && answer.replies.length > 0) {
-            answer.replies.forEach(reply => repliesContainer.appendChild(createAnswerElement(reply)));
-        }
-
-        // 2. 2단계 답글이 없지만, 총 갯수가 0보다 크면 '더보기' 버튼
-        // (즉, 3단계 이상 답글이 존재함)
-        if (answer.reply_count > answer.replies.length) {
-            const button = document.createElement('button');
-            button.className = 'btn btn-secondary btn-small load-more-replies';
-            button.textContent = `답글 더보기 (${answer.reply_count - answer.replies.length}개)`;
-            button.onclick = () => handleLoadReplies(answer.id);
-            loadMoreContainer.appendChild(button);
+        // 1. 함께 내려온 답글이 있으면 렌더링
+        const replies = answer.replies || [];
+        replies.forEach(reply => repliesContainer.appendChild(createAnswerElement(reply)));
+
+        // 2. 아직 불러오지 않은 답글이 있으면 '더보기' 버튼
+        if (answer.reply_count > replies.length) {
+            renderLoadMoreButton(
+                loadMoreContainer,
+                `답글 더보기 (${answer.reply_count - replies.length}개)`,
+                () => handleLoadReplies(answer.id),
+            );
         }
 
         return answerElement;
@@ -1064,34 +1100,21 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     /**
-     * 9. 깊은 답글 동적 로딩 핸들러
+     * 9. 답글 동적 로딩 핸들러 (커서 기반 페이지 단위)
      */
-    async function handleLoadReplies(answerId) {
-        const loadButton = document.querySelector(`#load-more-for-${answerId} button`);
-        loadButton.textContent = '로딩 중...';
-        loadButton.disabled = true;
-
-        try {
-            // 백엔드의 get_single_answer API 호출
-            const answerData = await fetchAPI(`/answer/${answerId}`);
-
-            const repliesContainer = document.getElementById(`replies-for-${answerId}`);
-            repliesContainer.innerHTML = ''; // 기존 얕은 답글(이 있다면) 지우고 새로 로드
-
-            if (answerData.replies && answerData.replies.length > 0) {
-                answerData.replies.forEach(reply => {
-                    repliesContainer.appendChild(createAnswerElement(reply));
-                });
-            } else {
-                repliesContainer.innerHTML = '<p>답글이 없습니다.</p>';
-            }
-
-            loadButton.parentElement.innerHTML = ''; // '더보기' 버튼 제거
-
-        } catch (error) {
-            alert(`답글 로딩 실패: ${error.message}`);
-            loadButton.textContent = '로딩 실패. 재시도';
-            loadButton.disabled = false;
+    async function handleLoadReplies(answerId, cursor = null) {
+        const repliesContainer = document.getElementById(`replies-for-${answerId}`);
+        const loadMoreContainer = document.getElementById(`load-more-for-${answerId}`);
+        const params = new URLSearchParams({ limit: PAGE_SIZE, include_total: false });
+        if (cursor) params.set('after', cursor);
+
+        const data = await fetchAPI(`/answer/${answerId}/replies?${params}`);
+        if (!cursor) repliesContainer.innerHTML = '';
+        data.items.forEach(reply => repliesContainer.appendChild(createAnswerElement(reply)));
+
+        loadMoreContainer.innerHTML = '';
+        if (data.next_cursor) {
+            renderLoadMoreButton(loadMoreContainer, '답글 더보기', () => handleLoadReplies(answerId, data.next_cursor));
         }
     }
 
@@ -0,0 +1,94 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from src.application.dtos import (
+    AnswerViewResponse,
+    PaginatedResponse,
+    QuestionViewResponse,
+    TodoViewResponse,
+)
+from src.application.services import CACHED_MODELS
+from src.infrastructure.adapters_out.cache import InMemoryCache, RedisCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, px: int) -> None:
+        self.values[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+def _question() -> QuestionViewResponse:
+    created = datetime(2026, 1, 1, tzinfo=UTC)
+    reply = AnswerViewResponse(
+        id='r1',
+        content='reply',
+        question_id='q1',
+        creator_ip='10.0.0.7',
+        parent_id='a1',
+        created_at=created,
+        updated_at=created,
+        deleted_at=created + timedelta(hours=1),
+        reply_count=0,
+    )
+    answer = AnswerViewResponse(
+        id='a1',
+        content='answer',
+        question_id='q1',
+        creator_ip='192.168.10.30',
+        created_at=created,
+        updated_at=created + timedelta(minutes=5),
+        replies=[reply],
+        reply_count=1,
+    )
+    return QuestionViewResponse(
+        id='q1',
+        subject='subject',
+        content='content',
+        creator_ip='192.168.10.20',
+        created_at=created,
+        updated_at=created,
+        answers=[answer],
+        answer_count=2,
+    )
+
+
+def _todo_page() -> PaginatedResponse[TodoViewResponse]:
+    created = datetime(2026, 1, 1, tzinfo=UTC)
+    todo = TodoViewResponse(
+        id='t1',
+        task='task',
+        is_completed=False,
+        creator_ip='172.16.0.9',
+        created_at=created,
+        updated_at=created,
+    )
+    return PaginatedResponse[TodoViewResponse](
+        total_items=1, items=[todo], page=1, page_size=10, next_cursor='c'
+    )
+
+
+async def _read_back(cache, value):
+    await cache.set('key', value)
+    return await cache.get('key')
+
+
+def test_backends_render_identical_bodies():
+    backends = (
+        InMemoryCache(max_size=10, ttl_seconds=60),
+        RedisCache(FakeRedis(), ttl_seconds=60, models=CACHED_MODELS),
+    )
+    for value in (_question(), _todo_page()):
+        bodies = [
+            asyncio.run(_read_back(cache, value)).model_dump_json()
+            for cache in backends
+        ]
+        assert bodies == [value.model_dump_json()] * len(backends)